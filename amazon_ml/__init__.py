@@ -0,0 +1,11 @@
+"""
+Entity value extraction from Amazon product images.
+
+Importing the package is cheap: only the regex / unit normalization layer
+is loaded here. OpenCV, EasyOCR and torch are imported by the submodules
+that need them (and EasyOCR only on the first OCR call).
+"""
+
+from amazon_ml.extract import extract_info, normalize_entity_name, process_units
+
+__all__ = ['extract_info', 'normalize_entity_name', 'process_units']
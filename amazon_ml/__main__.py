@@ -0,0 +1,5 @@
+import sys
+
+from amazon_ml.cli import main
+
+sys.exit(main())
@@ -0,0 +1,92 @@
+import os
+
+import cv2
+import pandas as pd
+
+from amazon_ml.extract import extract_info, normalize_entity_name
+from amazon_ml.ocr import get_reader
+from amazon_ml.profiles import get_profile
+from amazon_ml.tiling import PeakRSS, readtext_tiled
+
+# Function to process images in a directory and merge results with an input CSV
+def process_images_and_merge(input_csv, directory_path, output_csv, memory_budget_mb=None, use_profiles=True,
+                             prior_index=None):
+    # Load input CSV file
+    df = pd.read_csv(input_csv)
+
+    # Sort the CSV by 'image_link' column (assuming this column contains the image file names)
+    df = df.sort_values(by='image_link')
+
+    reader = get_reader()
+
+    fld_img = [name for name in sorted(os.listdir(directory_path))
+               if os.path.isfile(os.path.join(directory_path, name))]
+
+    # Match images to rows by file name: the CSV can list one image_link on several rows,
+    # so the folder can hold fewer images than there are rows.
+    image_names = df['image_link'].map(lambda link: os.path.basename(str(link)))
+    entities = {}
+    if 'entity_name' in df:
+        for image_name, entity_name in zip(image_names, df['entity_name']):
+            if isinstance(entity_name, str):
+                entities.setdefault(image_name, set()).add(entity_name)
+
+    # Text and extracted values per image name
+    texts, extracted = {}, {}
+
+    # Iterate through all image files in the directory
+    for image_name in fld_img:
+        image_path = os.path.join(directory_path, image_name)
+        # OCR each image with its rows' entity profile; an image shared by several entities gets
+        # EasyOCR defaults so no entity loses its unit letters to another's allowlist
+        names = entities.get(image_name, set())
+        profile = get_profile(next(iter(names))) if use_profiles and len(names) == 1 else {}
+
+        print(f"Processing {image_name}...")
+
+        # Perform text detection and extraction (tiled when a memory budget is set)
+        with PeakRSS() as peak:
+            if memory_budget_mb is not None:
+                results = readtext_tiled(cv2.imread(image_path), reader, memory_budget_mb, **profile)
+            else:
+                results = reader.readtext(image_path, **profile)
+        print(f"{image_name}: peak RSS {peak.mb:.1f} MB{'' if peak.exact else ' (process-wide)'}")
+
+        # Combine all extracted text into a single string
+        texts[image_name] = ' '.join([text for (bbox, text, prob) in results])
+
+        # Extract information using regex
+        extracted[image_name] = extract_info(texts[image_name])
+
+    # Create lists to hold extracted information, one entry per row
+    weights, heights, widths, depths, voltages, wattages, volumes = [], [], [], [], [], [], []
+
+    for image_name, (_, row) in zip(image_names, df.iterrows()):
+        extracted_info = dict(extracted.get(image_name, {}))
+
+        # Re-rank the row's own entity with its group_id unit prior
+        entity_name = row.get('entity_name')
+        if prior_index is not None and image_name in texts and isinstance(entity_name, str):
+            prior = prior_index.lookup(row.get('group_id'), entity_name)
+            if prior is not None:
+                extracted_info[normalize_entity_name(entity_name)] = extract_info(texts[image_name], entity_name,
+                                                                                  prior=prior)
+
+        # Add extracted data to respective lists
+        # weights.append(extracted_info.get('weight', 'Not found'))
+        voltages.append(extracted_info.get('voltage', 'Not found'))
+        wattages.append(extracted_info.get('wattage', 'Not found'))
+        volumes.append(extracted_info.get('volume', 'Not found'))
+
+    # Add new columns to the DataFrame
+    # df['Weight'] = weights
+    # df['Height'] = heights
+    # df['Width'] = widths
+    # df['Depth'] = depths
+    df['Voltage'] = voltages
+    df['Wattage'] = wattages
+    df['Volume'] = volumes
+
+    # Save the updated DataFrame to a new CSV file
+    df.to_csv(output_csv, index=False)
+    print(f"Extraction complete. Results saved in {output_csv}")
@@ -0,0 +1 @@
+"""Offline benchmarks and budget checks, runnable with `python -m amazon_ml.bench.<name>`."""
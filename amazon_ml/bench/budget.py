@@ -0,0 +1,71 @@
+import argparse
+import sys
+import time
+from collections import defaultdict
+
+import cv2
+
+from amazon_ml.bench.common import is_correct, load_labelled_rows
+from amazon_ml.budget import BudgetedReader, CanvasController, bucket_for, bucket_label, print_budget_report
+from amazon_ml.extract import extract_info
+from amazon_ml.ocr import get_reader
+from amazon_ml.profiles import get_profile
+
+# ----------------------------------------------------------
+# Latency-budget controller benchmark.
+#
+# OCRs each labelled image twice: once with its entity profile as is (the
+# fixed canvas) and once through a CanvasController at --budget-ms. It
+# reports budget adherence and the accuracy delta for each image-size
+# bucket, then prints the controller's learned per-bucket state.
+# Usage: python -m amazon_ml.bench.budget IMAGE_DIR --budget-ms 500 [--csv filtered_1000_rows.csv] [--limit 300]
+# ----------------------------------------------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the latency-budget canvas controller per size bucket.')
+    parser.add_argument('image_dir')
+    parser.add_argument('--budget-ms', type=float, required=True)
+    parser.add_argument('--csv', default='filtered_1000_rows.csv')
+    parser.add_argument('--limit', type=int, default=300)
+    parser.add_argument('--cpu', action='store_true', help='Run EasyOCR without a GPU.')
+    args = parser.parse_args(argv)
+
+    rows = load_labelled_rows(args.csv, args.image_dir, args.limit)
+    if not rows:
+        print("No labelled images found.")
+        return 1
+
+    reader = get_reader(gpu=not args.cpu)
+    controller = CanvasController(args.budget_ms)
+    budgeted = BudgetedReader(reader, controller)
+    # (bucket, mode) -> list of (latency_ms, correct)
+    samples = defaultdict(list)
+    for row in rows:
+        image = cv2.imread(row['image_path'])
+        if image is None:
+            continue
+        entity = row['entity_name']
+        bucket = bucket_for(*image.shape[:2])
+        for mode, ocr in (('fixed', reader), ('budget', budgeted)):
+            start = time.perf_counter()
+            results = ocr.readtext(image, **get_profile(entity))
+            latency = (time.perf_counter() - start) * 1000
+            text_string = ' '.join([text for (bbox, text, prob) in results])
+            samples[bucket, mode].append((latency, is_correct(row['values'], extract_info(text_string, entity))))
+
+    print(f"{'bucket':<12} {'n':>5} {'fixed within':>13} {'budget within':>14} "
+          f"{'fixed acc':>10} {'budget acc':>11} {'delta':>7}")
+    for bucket in sorted({bucket for bucket, _ in samples}):
+        fixed, budget = samples[bucket, 'fixed'], samples[bucket, 'budget']
+        within = [sum(latency <= args.budget_ms for latency, _ in values) / len(values) for values in (fixed, budget)]
+        accuracy = [sum(correct for _, correct in values) / len(values) for values in (fixed, budget)]
+        print(f"{bucket_label(bucket):<12} {len(fixed):>5} {within[0]:>13.1%} {within[1]:>14.1%} "
+              f"{accuracy[0]:>10.1%} {accuracy[1]:>11.1%} {(accuracy[1] - accuracy[0]) * 100:>+6.1f}pt")
+    print()
+    print_budget_report(controller)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import argparse
+import csv
+import sys
+import time
+from collections import Counter
+
+import cv2
+
+from amazon_ml.bench.common import is_correct, load_labelled_rows
+from amazon_ml.ocr import MIN_CONFIDENCE, TIERS, get_reader, run_cascade
+from amazon_ml.profiles import get_profile
+from amazon_ml.stats import percentile
+
+# ----------------------------------------------------------
+# Preprocessing cascade benchmark.
+#
+# Runs the cascade on labelled images and records which tier resolved each
+# one, so the tiers and confidence threshold can be tuned for throughput.
+# `--baseline` also times the old always-binarize-and-upscale pass.
+# Usage: python -m amazon_ml.bench.cascade IMAGE_DIR [--csv filtered_1000_rows.csv] [--out tiers.csv]
+# ----------------------------------------------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the confidence-driven preprocessing cascade.')
+    parser.add_argument('image_dir')
+    parser.add_argument('--csv', default='filtered_1000_rows.csv')
+    parser.add_argument('--limit', type=int, default=None)
+    parser.add_argument('--min-confidence', type=float, default=MIN_CONFIDENCE)
+    parser.add_argument('--baseline', action='store_true', help='Also run the binarize + 2x pass alone.')
+    parser.add_argument('--out', help='Write one row per image (tier, confidence, latency) to this CSV.')
+    parser.add_argument('--cpu', action='store_true', help='Run EasyOCR without a GPU.')
+    args = parser.parse_args(argv)
+
+    rows = load_labelled_rows(args.csv, args.image_dir, args.limit)
+    if not rows:
+        print("No labelled images found.")
+        return 1
+
+    reader = get_reader(gpu=not args.cpu)
+    modes = [('cascade', None)] + ([('baseline', TIERS[1:2])] if args.baseline else [])
+    records = []
+    for row in rows:
+        image = cv2.imread(row['image_path'])
+        if image is None:
+            continue
+        profile = get_profile(row['entity_name'])
+        for mode, tiers in modes:
+            start = time.perf_counter()
+            outcome = run_cascade(image, row['entity_name'], reader, tiers=tiers,
+                                  min_confidence=args.min_confidence, **profile)
+            records.append({
+                'image_path': row['image_path'],
+                'entity_name': row['entity_name'],
+                'mode': mode,
+                'tier': outcome['tier'] or 'unresolved',
+                'tiers_tried': outcome['tiers_tried'],
+                'confidence': round(outcome['confidence'], 4),
+                'latency_ms': round((time.perf_counter() - start) * 1000, 2),
+                'correct': int(is_correct(row['values'], outcome['value'])),
+            })
+
+    for mode, _ in modes:
+        mode_records = [r for r in records if r['mode'] == mode]
+        if not mode_records:
+            continue
+        latencies = [r['latency_ms'] for r in mode_records]
+        accuracy = sum(r['correct'] for r in mode_records) / len(mode_records)
+        print(f"{mode:<9} n={len(mode_records)} accuracy {accuracy:6.1%}  "
+              f"mean {sum(latencies) / len(latencies):8.1f} ms  p95 {percentile(latencies, 95):8.1f} ms  "
+              f"throughput {len(latencies) / (sum(latencies) / 1000):6.2f} img/s")
+        tiers = Counter(r['tier'] for r in mode_records)
+        for tier, count in tiers.most_common():
+            tier_records = [r for r in mode_records if r['tier'] == tier]
+            tier_accuracy = sum(r['correct'] for r in tier_records) / count
+            print(f"    {tier:<12} {count:>5} images  accuracy {tier_accuracy:6.1%}")
+
+    if args.out and records:
+        with open(args.out, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=list(records[0]))
+            writer.writeheader()
+            writer.writerows(records)
+        print(f"Per-image tiers saved in {args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
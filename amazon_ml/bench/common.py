@@ -0,0 +1,45 @@
+import csv
+import os
+
+from amazon_ml.extract import parse_entity_value
+
+# ----------------------------------------------------------
+# Shared helpers for the offline benchmarks.
+#
+# Benchmarks read a labelled CSV (image_link, group_id, entity_name,
+# entity_value) and look images up by the basename of `image_link` in a
+# local directory, e.g. Height_2500/41XM9J3d5SL.jpg. Rows whose image is
+# not cached locally are skipped, so nothing is ever downloaded.
+# ----------------------------------------------------------
+
+
+def load_labelled_rows(csv_path, image_dir, limit=None, entity_name=None):
+    rows, missing = [], 0
+    with open(csv_path, newline='') as f:
+        for row in csv.DictReader(f):
+            if entity_name is not None and row['entity_name'] != entity_name:
+                continue
+            image_path = os.path.join(image_dir, os.path.basename(row['image_link']))
+            if not os.path.isfile(image_path):
+                missing += 1
+                continue
+            values, unit = parse_entity_value(row.get('entity_value'))
+            rows.append({
+                'image_path': image_path,
+                'group_id': row.get('group_id'),
+                'entity_name': row['entity_name'],
+                'values': values,
+                'unit': unit,
+            })
+            if limit is not None and len(rows) >= limit:
+                break
+    if missing:
+        print(f"Skipped {missing} rows without a cached image in {image_dir}")
+    return rows
+
+
+def is_correct(expected_values, predicted, tolerance=1e-6):
+    # A prediction counts when every labelled value is among the extracted values.
+    if not expected_values or not isinstance(predicted, (list, tuple)):
+        return False
+    return all(any(abs(e - p) <= tolerance for p in predicted) for e in expected_values)
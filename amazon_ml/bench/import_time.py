@@ -0,0 +1,56 @@
+import argparse
+import subprocess
+import sys
+
+# ----------------------------------------------------------
+# Import-time budget check.
+#
+# Imports a module in a fresh interpreter, measures the wall time of the
+# import and fails if it exceeds the budget or drags in a heavy dependency.
+# Usage: python -m amazon_ml.bench.import_time [--module amazon_ml.extract] [--budget-ms 50]
+# ----------------------------------------------------------
+
+HEAVY_MODULES = ('cv2', 'easyocr', 'torch', 'matplotlib', 'numpy', 'pandas')
+
+_PROBE = """
+import sys, time
+t0 = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - t0) * 1000
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed)
+print(','.join(heavy))
+"""
+
+
+def measure_import(module, repeat=5):
+    # Best-of-N import time in milliseconds and the heavy modules it loaded.
+    best, heavy = None, []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                             check=True, capture_output=True, text=True).stdout.splitlines()
+        elapsed = float(out[0])
+        heavy = [m for m in out[1].split(',') if m] if len(out) > 1 else []
+        best = elapsed if best is None else min(best, elapsed)
+    return best, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Check the import-time budget of a module.')
+    parser.add_argument('--module', action='append',
+                        help='Module to check (repeatable). Defaults to the regex layer and the package root.')
+    parser.add_argument('--budget-ms', type=float, default=50.0)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.module or ['amazon_ml.extract', 'amazon_ml', 'amazon_ml.cli']:
+        elapsed, heavy = measure_import(module, args.repeat)
+        ok = elapsed <= args.budget_ms and not heavy
+        failed |= not ok
+        print(f"{module:<24} {elapsed:8.2f} ms  heavy={heavy or '-'}  {'OK' if ok else 'FAIL'}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
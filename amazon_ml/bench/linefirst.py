@@ -0,0 +1,77 @@
+import argparse
+import sys
+import time
+from collections import defaultdict
+
+import cv2
+
+from amazon_ml.bench.common import is_correct, load_labelled_rows
+from amazon_ml.extract import extract_info
+from amazon_ml.geometry import analyze_dimensions
+from amazon_ml.linefirst import analyze_line_first
+from amazon_ml.ocr import get_reader
+from amazon_ml.stats import percentile
+
+# ----------------------------------------------------------
+# Line-first vs full-image geometric analysis.
+#
+# Reports, per labelled dimension image, how much of the image the
+# line-first pipeline sends to OCR, the end-to-end speedup over OCR'ing
+# the full image, and the accuracy of the top candidate for both.
+# Usage: python -m amazon_ml.bench.linefirst IMAGE_DIR [--csv filtered_data_height.csv ...]
+# ----------------------------------------------------------
+
+
+def top_correct(analysis, row):
+    found = analysis.get(row['entity_name']) or []
+    text = found[0].text if found else ''
+    return is_correct(row['values'], extract_info(text, row['entity_name']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the line-first dimension pipeline.')
+    parser.add_argument('image_dir')
+    parser.add_argument('--csv', action='append', help='Labelled CSV (repeatable).')
+    parser.add_argument('--limit', type=int, default=100, help='Images per CSV.')
+    parser.add_argument('--line-engine', default='projection')
+    parser.add_argument('--cpu', action='store_true', help='Run EasyOCR without a GPU.')
+    args = parser.parse_args(argv)
+
+    rows = []
+    for csv_path in args.csv or ['filtered_data_height.csv', 'filtered_data_width.csv', 'filtered_data_depth.csv']:
+        rows += load_labelled_rows(csv_path, args.image_dir, args.limit)
+    if not rows:
+        print("No labelled images found.")
+        return 1
+
+    reader = get_reader(gpu=not args.cpu)
+    times, correct = defaultdict(list), defaultdict(int)
+    fractions, fallbacks = [], 0
+    for row in rows:
+        image = cv2.imread(row['image_path'])
+        if image is None:
+            continue
+        start = time.perf_counter()
+        analysis = analyze_dimensions(image, reader=reader, engine=args.line_engine)
+        times['full'].append(time.perf_counter() - start)
+        correct['full'] += top_correct(analysis, row)
+
+        start = time.perf_counter()
+        analysis, stats = analyze_line_first(image, reader=reader, engine=args.line_engine)
+        times['line_first'].append(time.perf_counter() - start)
+        correct['line_first'] += top_correct(analysis, row)
+        fractions.append(stats['ocr_pixel_fraction'])
+        fallbacks += stats['fallback']
+
+    n = len(fractions)
+    for mode in ('full', 'line_first'):
+        print(f"{mode:<11} n={n} accuracy {correct[mode] / n:6.1%}  mean {sum(times[mode]) / n * 1000:8.1f} ms  "
+              f"p95 {percentile(times[mode], 95) * 1000:8.1f} ms")
+    print(f"pixels sent to OCR: mean {sum(fractions) / n:.1%}, p50 {percentile(fractions, 50):.1%}; "
+          f"full-image fallbacks: {fallbacks}/{n}")
+    print(f"speedup: {sum(times['full']) / sum(times['line_first']):.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
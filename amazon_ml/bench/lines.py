@@ -0,0 +1,72 @@
+import argparse
+import contextlib
+import io
+import sys
+import time
+from collections import defaultdict
+
+import cv2
+
+from amazon_ml.bench.common import is_correct, load_labelled_rows
+from amazon_ml.dimensions import detect_entity_in_image
+from amazon_ml.extract import extract_info
+from amazon_ml.lines import available_engines
+from amazon_ml.ocr import get_reader
+from amazon_ml.profiles import get_profile
+from amazon_ml.stats import percentile
+
+# ----------------------------------------------------------
+# Line-detection engine benchmark.
+#
+# OCRs each labelled height/width image once, then re-runs the ROI line
+# classification with every engine on the same OCR results, so the timings
+# cover line detection only. Reports width/height accuracy and latency.
+# Usage: python -m amazon_ml.bench.lines IMAGE_DIR [--csv filtered_data_height.csv --csv filtered_data_width.csv]
+# ----------------------------------------------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark line-detection engines for dimension classification.')
+    parser.add_argument('image_dir')
+    parser.add_argument('--csv', action='append', help='Labelled CSV (repeatable).')
+    parser.add_argument('--engine', action='append', help='Engine to run (repeatable). Defaults to all available.')
+    parser.add_argument('--limit', type=int, default=200, help='Images per CSV.')
+    parser.add_argument('--cpu', action='store_true', help='Run EasyOCR without a GPU.')
+    args = parser.parse_args(argv)
+
+    rows = []
+    for csv_path in args.csv or ['filtered_data_height.csv', 'filtered_data_width.csv']:
+        rows += load_labelled_rows(csv_path, args.image_dir, args.limit)
+    if not rows:
+        print("No labelled images found.")
+        return 1
+
+    engines = args.engine or available_engines()
+    reader = get_reader(gpu=not args.cpu)
+    # (entity, engine) -> list of (latency, correct)
+    samples = defaultdict(list)
+    for row in rows:
+        image = cv2.imread(row['image_path'])
+        if image is None:
+            continue
+        entity = row['entity_name']
+        results = reader.readtext(image, **get_profile(entity))
+        for engine in engines:
+            # The detection code is chatty; keep the report readable.
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                text = detect_entity_in_image(image, entity, engine=engine, results=results)
+                latency = time.perf_counter() - start
+            samples[entity, engine].append((latency, is_correct(row['values'], extract_info(text or '', entity))))
+
+    print(f"{'entity':<8} {'engine':<11} {'n':>5} {'accuracy':>9} {'mean ms':>9} {'p95 ms':>9}")
+    for (entity, engine), values in sorted(samples.items()):
+        latencies = [latency for latency, _ in values]
+        accuracy = sum(correct for _, correct in values) / len(values)
+        print(f"{entity:<8} {engine:<11} {len(values):>5} {accuracy:>9.1%} "
+              f"{sum(latencies) / len(latencies) * 1000:>9.2f} {percentile(latencies, 95) * 1000:>9.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import argparse
+import sys
+import time
+
+import cv2
+
+from amazon_ml.bench.common import is_correct, load_labelled_rows
+from amazon_ml.extract import extract_info
+from amazon_ml.ocr import get_reader
+from amazon_ml.orientation import OrientedReader
+from amazon_ml.stats import percentile
+
+# ----------------------------------------------------------
+# Orientation-aware OCR vs blanket rotation.
+#
+# Compares, on labelled images (default: the height set), plain readtext,
+# readtext(rotation_info=[90, 180, 270]) and OrientedReader, reporting
+# how often the labelled value is recovered and per-image latency.
+# Usage: python -m amazon_ml.bench.orientation IMAGE_DIR [--csv filtered_data_height.csv] [--limit 200]
+# ----------------------------------------------------------
+
+
+def run_mode(name, readtext, rows, entity):
+    latencies, correct = [], 0
+    for row in rows:
+        image = cv2.imread(row['image_path'])
+        if image is None:
+            continue
+        start = time.perf_counter()
+        results = readtext(image)
+        latencies.append(time.perf_counter() - start)
+        text_string = ' '.join([text for (bbox, text, prob) in results])
+        correct += is_correct(row['values'], extract_info(text_string, entity))
+    n = len(latencies) or 1
+    print(f"{name:<18} accuracy {correct / n:6.1%}  mean {sum(latencies) / n * 1000:8.1f} ms  "
+          f"p50 {percentile(latencies, 50) * 1000:8.1f} ms  p95 {percentile(latencies, 95) * 1000:8.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark orientation-aware OCR against blanket rotation.')
+    parser.add_argument('image_dir')
+    parser.add_argument('--csv', default='filtered_data_height.csv')
+    parser.add_argument('--entity', default='height')
+    parser.add_argument('--limit', type=int, default=200)
+    parser.add_argument('--cpu', action='store_true', help='Run EasyOCR without a GPU.')
+    args = parser.parse_args(argv)
+
+    rows = load_labelled_rows(args.csv, args.image_dir, args.limit, args.entity)
+    if not rows:
+        print("No labelled images found.")
+        return 1
+    print(f"{len(rows)} images")
+
+    reader = get_reader(gpu=not args.cpu)
+    oriented = OrientedReader(reader)
+    run_mode('upright only', reader.readtext, rows, args.entity)
+    run_mode('blanket rotation', lambda image: reader.readtext(image, rotation_info=[90, 180, 270]), rows, args.entity)
+    run_mode('oriented', oriented.readtext, rows, args.entity)
+    print(f"oriented box decisions: {oriented.stats}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
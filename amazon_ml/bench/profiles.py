@@ -0,0 +1,61 @@
+import argparse
+import sys
+import time
+from collections import defaultdict
+
+import cv2
+
+from amazon_ml.bench.common import is_correct, load_labelled_rows
+from amazon_ml.extract import extract_info
+from amazon_ml.ocr import get_reader
+from amazon_ml.profiles import get_profile
+from amazon_ml.stats import percentile
+
+# ----------------------------------------------------------
+# Per-entity OCR profile benchmark.
+#
+# OCRs each labelled image with EasyOCR defaults and with the profile for
+# its `entity_name`, and reports accuracy and latency per entity.
+# Usage: python -m amazon_ml.bench.profiles IMAGE_DIR [--csv filtered_1000_rows.csv] [--limit 300]
+# ----------------------------------------------------------
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark per-entity OCR profiles against EasyOCR defaults.')
+    parser.add_argument('image_dir')
+    parser.add_argument('--csv', default='filtered_1000_rows.csv')
+    parser.add_argument('--limit', type=int, default=300)
+    parser.add_argument('--cpu', action='store_true', help='Run EasyOCR without a GPU.')
+    args = parser.parse_args(argv)
+
+    rows = load_labelled_rows(args.csv, args.image_dir, args.limit)
+    if not rows:
+        print("No labelled images found.")
+        return 1
+
+    reader = get_reader(gpu=not args.cpu)
+    # (entity, mode) -> list of (latency, correct)
+    samples = defaultdict(list)
+    for row in rows:
+        image = cv2.imread(row['image_path'])
+        if image is None:
+            continue
+        entity = row['entity_name']
+        for mode, kwargs in (('default', {}), ('profile', get_profile(entity))):
+            start = time.perf_counter()
+            results = reader.readtext(image, **kwargs)
+            latency = time.perf_counter() - start
+            text_string = ' '.join([text for (bbox, text, prob) in results])
+            samples[entity, mode].append((latency, is_correct(row['values'], extract_info(text_string, entity))))
+
+    print(f"{'entity':<32} {'mode':<8} {'n':>5} {'accuracy':>9} {'mean ms':>9} {'p95 ms':>9}")
+    for (entity, mode), values in sorted(samples.items()):
+        latencies = [latency for latency, _ in values]
+        accuracy = sum(correct for _, correct in values) / len(values)
+        print(f"{entity:<32} {mode:<8} {len(values):>5} {accuracy:>9.1%} "
+              f"{sum(latencies) / len(latencies) * 1000:>9.1f} {percentile(latencies, 95) * 1000:>9.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
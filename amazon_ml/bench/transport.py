@@ -0,0 +1,141 @@
+import argparse
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+
+from amazon_ml.transport import SharedRing
+
+# ----------------------------------------------------------
+# Shared-memory transport benchmark.
+#
+# A producer process sends decoded frames to a consumer process, which
+# reads a centre ROI of each frame (standing in for the OCR and line
+# stages). Two transports are compared:
+#   pickle  ndarrays through a multiprocessing.Queue: pickled, piped, unpickled
+#   shm     frames copied once into a SharedRing; only handles are pickled
+# The report gives throughput and the bytes copied in user space and sent
+# through the pipe.
+# Usage: python -m amazon_ml.bench.transport [--frames 500] [--size 1500x1500] [--image-dir Height_2500/]
+# ----------------------------------------------------------
+
+
+def load_frames(image_dir, size, count=8):
+    # A few decoded frames to cycle through: real images when given, else random noise.
+    if image_dir:
+        import cv2
+
+        frames = []
+        for name in sorted(os.listdir(image_dir)):
+            image = cv2.imread(os.path.join(image_dir, name))
+            if image is not None:
+                frames.append(image)
+            if len(frames) >= count:
+                break
+        if frames:
+            return frames
+        print(f"No readable images in {image_dir}; using synthetic frames")
+    width, height = (int(v) for v in size.lower().split('x'))
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def _roi_mean(image):
+    height, width = image.shape[:2]
+    return float(image[height // 4:3 * height // 4, width // 4:3 * width // 4].mean())
+
+
+def _pickle_consumer(queue, done):
+    count = 0
+    while True:
+        frame = queue.get()
+        if frame is None:
+            break
+        _roi_mean(frame)
+        count += 1
+    done.put(count)
+
+
+def _shm_consumer(ring, queue, done):
+    count = 0
+    while True:
+        handle = queue.get()
+        if handle is None:
+            break
+        height, width = handle.shape[:2]
+        roi = ring.view(ring.crop(handle, width // 4, height // 4, 3 * width // 4, 3 * height // 4))
+        float(roi.mean())
+        del roi
+        ring.release(handle)
+        count += 1
+    ring.close()
+    done.put(count)
+
+
+def run_pickle(frames, total, depth):
+    queue, done = multiprocessing.Queue(maxsize=depth), multiprocessing.Queue()
+    consumer = multiprocessing.Process(target=_pickle_consumer, args=(queue, done))
+    consumer.start()
+    start = time.perf_counter()
+    for i in range(total):
+        queue.put(frames[i % len(frames)])
+    queue.put(None)
+    count = done.get()
+    elapsed = time.perf_counter() - start
+    consumer.join()
+
+    payload = sum(len(pickle.dumps(frames[i % len(frames)], pickle.HIGHEST_PROTOCOL)) for i in range(len(frames)))
+    payload = payload * total / len(frames)
+    # Pickling and unpickling each copy the payload once; the pipe carries all of it.
+    return {'transport': 'pickle', 'frames': count, 'seconds': elapsed, 'copied': 2 * payload, 'piped': payload}
+
+
+def run_shm(frames, total, depth, ring_mb):
+    ring = SharedRing(size_mb=ring_mb)
+    queue, done = multiprocessing.Queue(maxsize=depth), multiprocessing.Queue()
+    consumer = multiprocessing.Process(target=_shm_consumer, args=(ring, queue, done))
+    consumer.start()
+    copied = 0
+    start = time.perf_counter()
+    for i in range(total):
+        frame = frames[i % len(frames)]
+        handle = ring.put(frame, timeout=60)
+        queue.put(handle)
+        copied += frame.nbytes
+    queue.put(None)
+    count = done.get()
+    elapsed = time.perf_counter() - start
+    consumer.join()
+    ring.close()
+
+    piped = len(pickle.dumps(handle, pickle.HIGHEST_PROTOCOL)) * total
+    return {'transport': 'shm', 'frames': count, 'seconds': elapsed, 'copied': copied, 'piped': piped}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark shared-memory frame transport against pickled queues.')
+    parser.add_argument('--frames', type=int, default=500)
+    parser.add_argument('--size', default='1500x1500', help='Synthetic frame size WIDTHxHEIGHT.')
+    parser.add_argument('--image-dir', help='Decode frames from these images instead.')
+    parser.add_argument('--depth', type=int, default=8, help='Frames in flight between the two processes.')
+    parser.add_argument('--ring-mb', type=float, default=256)
+    args = parser.parse_args(argv)
+
+    frames = load_frames(args.image_dir, args.size)
+    frame_mb = sum(frame.nbytes for frame in frames) / len(frames) / 1e6
+    print(f"{args.frames} frames of {frame_mb:.1f} MB on average")
+
+    runs = [run_pickle(frames, args.frames, args.depth), run_shm(frames, args.frames, args.depth, args.ring_mb)]
+    print(f"{'transport':<10} {'frames/s':>9} {'MB/s':>9} {'copied MB':>10} {'piped MB':>10}")
+    for run in runs:
+        rate = run['frames'] / run['seconds']
+        print(f"{run['transport']:<10} {rate:>9.1f} {rate * frame_mb:>9.1f} "
+              f"{run['copied'] / 1e6:>10.1f} {run['piped'] / 1e6:>10.3f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,243 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# ----------------------------------------------------------
+# Latency-budget controller for the OCR detector resolution.
+#
+# CRAFT's cost grows with the area of the canvas it runs on, which is
+# min(canvas_size, mag_ratio * longest side) scaled over the image. For
+# each image the controller lists (canvas_size, mag_ratio) options from
+# sharpest to cheapest and predicts their cost from a per-size-bucket
+# ms-per-megapixel estimate that it learns online. It then picks the
+# sharpest option that fits the budget. When a bucket keeps overrunning
+# (e.g. under load), it steps that bucket down a level until it recovers.
+#
+# The budget is per image, not per `readtext` call. The cascade, tiling and
+# line-first bands make several calls for one image. Inside
+# `BudgetedReader.image(...)` the first call gets the whole budget, each
+# later call gets only what is left, and the image's total time and
+# detector pixels are recorded once.
+# ----------------------------------------------------------
+
+CANVAS_LEVELS = (2560, 1920, 1280, 960, 640)
+MAG_RATIOS = (1.0, 1.5, 2.0)
+
+# (upper bound of the longest image side, recognizer batch size)
+BUCKETS = (
+    (400, 4),
+    (800, 4),
+    (1600, 8),
+    (3200, 16),
+    (float('inf'), 16),
+)
+
+# Starting guess for detector + recognizer cost; replaced by measurements.
+INITIAL_MS_PER_MEGAPIXEL = 400.0
+
+
+def bucket_for(height, width):
+    longest = max(height, width)
+    for i, (upper, _) in enumerate(BUCKETS):
+        if longest < upper:
+            return i
+    return len(BUCKETS) - 1
+
+
+def bucket_label(bucket):
+    lower = 0 if bucket == 0 else BUCKETS[bucket - 1][0]
+    upper = BUCKETS[bucket][0]
+    return f"{lower}-{upper}px" if upper != float('inf') else f"{lower}px+"
+
+
+def canvas_megapixels(height, width, canvas_size, mag_ratio):
+    # Pixels the detector actually processes, mirroring EasyOCR's resize_aspect_ratio.
+    longest = max(height, width)
+    target = min(canvas_size, mag_ratio * longest)
+    ratio = target / longest
+    return height * width * ratio * ratio / 1e6
+
+
+def resolution_options(height, width, max_canvas=None):
+    # Distinct (canvas_size, mag_ratio, megapixels) options, sharpest first; ties keep the smallest mag_ratio.
+    # A cap (profile or tile canvas) clamps the levels above it rather than removing them, so even a
+    # cap below the smallest level leaves one option and a 1600 profile can still run at 1600.
+    levels = CANVAS_LEVELS if max_canvas is None else sorted({min(level, max_canvas) for level in CANVAS_LEVELS},
+                                                              reverse=True)
+    options, seen = [], set()
+    for canvas_size in levels:
+        for mag_ratio in MAG_RATIOS:
+            megapixels = canvas_megapixels(height, width, canvas_size, mag_ratio)
+            key = round(megapixels, 3)
+            if key not in seen:
+                seen.add(key)
+                options.append((canvas_size, mag_ratio, megapixels))
+    options.sort(key=lambda option: option[2], reverse=True)
+    return options
+
+
+class CanvasController:
+    """
+    Picks detector canvas size, magnification and recognizer batch size per
+    image so OCR fits `budget_ms`, learning the cost per size bucket online.
+
+    Args:
+        budget_ms (float): Per-image OCR latency budget.
+        alpha (float): EWMA weight of new cost / overrun measurements.
+        target_overrun (float): Acceptable fraction of images over budget per
+            bucket before that bucket is degraded a level.
+    """
+
+    def __init__(self, budget_ms, alpha=0.2, target_overrun=0.05, cooldown=10):
+        self.budget_ms = budget_ms
+        self.alpha = alpha
+        self.target_overrun = target_overrun
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._buckets = [{
+            'ms_per_mpx': INITIAL_MS_PER_MEGAPIXEL,
+            'overrun': 0.0,
+            'penalty': 0,
+            'since_change': 0,
+            'count': 0,
+            'within': 0,
+            'total_ms': 0.0,
+            'levels': {},
+        } for _ in BUCKETS]
+
+    def choose(self, height, width, max_canvas=None, remaining_ms=None, bucket=None):
+        """
+        Settings for one `readtext` call on a `height` x `width` input.
+
+        Args:
+            remaining_ms (float, optional): What is left of the image's budget;
+                defaults to the whole budget.
+            bucket (int, optional): The image's size bucket, when the input is
+                a tile, band or upscaled tier of a larger or smaller image.
+
+        Returns:
+            tuple: (readtext kwargs, detector megapixels they will process).
+        """
+        bucket = bucket_for(height, width) if bucket is None else bucket
+        budget_ms = self.budget_ms if remaining_ms is None else remaining_ms
+        options = resolution_options(height, width, max_canvas)
+        with self._lock:
+            state = self._buckets[bucket]
+            index = len(options) - 1
+            for i, (_, _, megapixels) in enumerate(options):
+                if megapixels * state['ms_per_mpx'] <= budget_ms:
+                    index = i
+                    break
+            # Under sustained overruns, degrade this bucket below what the model predicts.
+            index = min(len(options) - 1, index + state['penalty'])
+        canvas_size, mag_ratio, megapixels = options[index]
+        settings = {'canvas_size': canvas_size, 'mag_ratio': mag_ratio, 'batch_size': BUCKETS[bucket][1]}
+        return settings, megapixels
+
+    def record(self, bucket, megapixels, elapsed_ms, level):
+        # One image: its total OCR time, the detector megapixels of all its calls, and its first call's level.
+        with self._lock:
+            state = self._buckets[bucket]
+            if megapixels > 0:
+                state['ms_per_mpx'] += self.alpha * (elapsed_ms / megapixels - state['ms_per_mpx'])
+            over = elapsed_ms > self.budget_ms
+            state['overrun'] += self.alpha * (over - state['overrun'])
+            state['count'] += 1
+            state['within'] += not over
+            state['total_ms'] += elapsed_ms
+            state['levels'][level] = state['levels'].get(level, 0) + 1
+
+            state['since_change'] += 1
+            if state['since_change'] >= self.cooldown:
+                if state['overrun'] > 2 * self.target_overrun:
+                    state['penalty'] += 1
+                    state['since_change'] = 0
+                elif state['overrun'] < self.target_overrun / 2 and state['penalty'] > 0:
+                    state['penalty'] -= 1
+                    state['since_change'] = 0
+
+    def report(self):
+        # Per-bucket budget adherence, mean latency, learned cost and chosen levels.
+        rows = []
+        with self._lock:
+            for bucket, state in enumerate(self._buckets):
+                if not state['count']:
+                    continue
+                rows.append({
+                    'bucket': bucket_label(bucket),
+                    'images': state['count'],
+                    'adherence': state['within'] / state['count'],
+                    'mean_ms': state['total_ms'] / state['count'],
+                    'ms_per_mpx': state['ms_per_mpx'],
+                    'penalty': state['penalty'],
+                    'levels': dict(state['levels']),
+                })
+        return rows
+
+
+def print_budget_report(controller):
+    print(f"budget {controller.budget_ms:g} ms")
+    print(f"{'bucket':<12} {'images':>7} {'within':>7} {'mean ms':>9} {'ms/Mpx':>8} {'penalty':>8}  levels")
+    for row in controller.report():
+        print(f"{row['bucket']:<12} {row['images']:>7} {row['adherence']:>7.1%} {row['mean_ms']:>9.1f} "
+              f"{row['ms_per_mpx']:>8.1f} {row['penalty']:>8}  {row['levels']}")
+
+
+class BudgetedReader:
+    """
+    Drop-in wrapper around an EasyOCR reader whose `readtext` runs with the
+    controller's resolution for each image. A `canvas_size` passed by the
+    caller (e.g. from an OCR profile or tiling) acts as an upper bound.
+
+    Wrap all OCR of one image in `with reader.image(image):` so the calls
+    share one budget; a `readtext` call outside it counts as its own image.
+    """
+
+    def __init__(self, reader, controller):
+        self.reader = reader
+        self.controller = controller
+        # Per-thread state of the image being OCR'd (the HTTP server shares one reader).
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        # detect/recognize etc. pass straight through (e.g. for OrientedReader).
+        return getattr(self.reader, name)
+
+    @contextmanager
+    def image(self, image):
+        if getattr(self._local, 'state', None) is not None:
+            # Already inside an image scope: these calls are part of that image.
+            yield self
+            return
+        height, width = image.shape[:2]
+        state = {'bucket': bucket_for(height, width), 'start': time.perf_counter(), 'megapixels': 0.0, 'level': None}
+        self._local.state = state
+        try:
+            yield self
+        finally:
+            self._local.state = None
+            if state['level'] is not None:
+                elapsed_ms = (time.perf_counter() - state['start']) * 1000
+                self.controller.record(state['bucket'], state['megapixels'], elapsed_ms, state['level'])
+
+    def readtext(self, image, **kwargs):
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            with self.image(image):
+                return self.readtext(image, **kwargs)
+        remaining_ms = self.controller.budget_ms - (time.perf_counter() - state['start']) * 1000
+        height, width = image.shape[:2]
+        settings, megapixels = self.controller.choose(height, width, kwargs.get('canvas_size'),
+                                                      remaining_ms, state['bucket'])
+        kwargs.update(settings)
+        state['megapixels'] += megapixels
+        if state['level'] is None:
+            state['level'] = f"{settings['canvas_size']}@{settings['mag_ratio']:g}"
+        return self.reader.readtext(image, **kwargs)
+
+
+def image_budget(reader, image):
+    # Scope one image's OCR calls under a single budget when `reader` is a BudgetedReader.
+    if isinstance(reader, BudgetedReader) and image is not None:
+        return reader.image(image)
+    return nullcontext()
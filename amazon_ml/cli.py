@@ -0,0 +1,398 @@
+import argparse
+import os
+
+# ----------------------------------------------------------
+# Command line entry point: `python -m amazon_ml <command> ...`
+#
+# Each command imports its (heavy) implementation module only when it runs,
+# so `--help` and the regex commands never load OpenCV or EasyOCR.
+# ----------------------------------------------------------
+
+
+def cmd_extract(args):
+    from amazon_ml.extract import extract_info
+
+    extracted_info = extract_info(args.text)
+    for entity, values in extracted_info.items():
+        print(f"{entity.capitalize()}: {values}")
+    return 0
+
+
+def line_engine_available(args):
+    # --line-engine choices are static (parsing must not import OpenCV); check the build here.
+    from amazon_ml.lines import available_engines
+
+    if args.line_engine in available_engines():
+        return True
+    print(f"Line engine '{args.line_engine}' is not available in this OpenCV build; "
+          f"choose one of {available_engines()}")
+    return False
+
+
+def cmd_detect(args):
+    from amazon_ml.dimensions import detect_entity_in_image
+
+    from amazon_ml.tiling import PeakRSS
+
+    if not line_engine_available(args):
+        return 2
+    debug = debug_sink(args)
+    with PeakRSS() as peak:
+        result = detect_entity_in_image(args.image, args.entity, gpu=not args.cpu,
+                                        memory_budget_mb=args.memory_budget_mb, oriented=args.oriented,
+                                        use_profile=not args.no_profile, engine=args.line_engine, debug=debug)
+    if debug is not None:
+        debug.close()
+    print("----------")
+    print(f"Detected entity: {result}")
+    print(f"Peak RSS: {peak.mb:.1f} MB{'' if peak.exact else ' (process-wide)'}")
+    print("----------")
+    return 0 if result is not None else 1
+
+
+def cmd_dimensions(args):
+    import cv2
+    from amazon_ml.geometry import DIMENSIONS, analyze_dimensions
+    from amazon_ml.linefirst import analyze_line_first
+
+    if not line_engine_available(args):
+        return 2
+    image = cv2.imread(args.image)
+    if image is None:
+        print(f"Failed to load image from path: {args.image}")
+        return 1
+    if args.line_first:
+        analysis, stats = analyze_line_first(image, engine=args.line_engine)
+        print(f"OCR'd {stats['ocr_pixel_fraction']:.1%} of the pixels in {stats['windows']} windows"
+              f"{' (no long lines, full-image fallback)' if stats['fallback'] else ''}")
+    else:
+        analysis = analyze_dimensions(image, engine=args.line_engine)
+    for dimension in DIMENSIONS:
+        print(f"{dimension}:")
+        for candidate in analysis[dimension][:args.top]:
+            print(f"    {candidate.text!r:<20} score {candidate.score:.3f}  line {candidate.line}")
+    return 0
+
+
+def cmd_ocr(args):
+    import cv2
+    from amazon_ml.ocr import run_cascade
+    from amazon_ml.profiles import get_profile
+    from amazon_ml.tiling import PeakRSS
+
+    prior = load_prior(args, args.entity)
+
+    with PeakRSS() as peak:
+        image = cv2.imread(args.image)
+        if image is None:
+            print(f"Failed to load image from path: {args.image}")
+            return 1
+        profile = {} if args.no_profile else get_profile(args.entity)
+        outcome = run_cascade(image, args.entity, memory_budget_mb=args.memory_budget_mb, prior=prior, **profile)
+    print(f"{outcome['value']}  (tier: {outcome['tier']}, confidence: {outcome['confidence']:.2f}, "
+          f"tiers tried: {outcome['tiers_tried']})")
+    print(f"Peak RSS: {peak.mb:.1f} MB{'' if peak.exact else ' (process-wide)'}")
+    return 0
+
+
+def cmd_batch(args):
+    from amazon_ml.batch import process_images_and_merge
+    from amazon_ml.priors import load_prior_index
+
+    process_images_and_merge(args.input_csv, args.image_dir, args.output_csv,
+                             memory_budget_mb=args.memory_budget_mb, use_profiles=not args.no_profile,
+                             prior_index=load_prior_index(args.priors) if args.priors else None)
+    return 0
+
+
+def cmd_build_priors(args):
+    import time
+    from amazon_ml.priors import DEFAULT_CSVS, build_prior_index, load_prior_index
+
+    count = build_prior_index(args.csv or DEFAULT_CSVS, args.out)
+    start = time.perf_counter()
+    load_prior_index(args.out)
+    print(f"Wrote {count} records to {args.out} "
+          f"({os.path.getsize(args.out)} bytes, loads in {(time.perf_counter() - start) * 1000:.2f} ms)")
+    return 0
+
+
+def load_prior(args, entity_name):
+    # The group_id unit prior for one image, if --priors and --group-id were given.
+    if not (args.priors and args.group_id):
+        return None
+    from amazon_ml.priors import load_prior_index
+
+    return load_prior_index(args.priors).lookup(args.group_id, entity_name)
+
+
+def cmd_queue(args):
+    from amazon_ml.jobqueue import JobQueue, run_worker
+
+    queue = JobQueue(args.db, shared_fs=args.shared_fs)
+    if args.queue_command == 'init':
+        print(f"Queued {queue.enqueue_csv(args.csv)} new rows from {args.csv}")
+    elif args.queue_command == 'work':
+        from amazon_ml.predict import predict_job
+        from amazon_ml.priors import load_prior_index
+
+        prior_index = load_prior_index(args.priors) if args.priors else None
+        reader = budgeted_reader(args)
+        debug = debug_sink(args)
+        completed = run_worker(queue, lambda job: predict_job(job, prior_index, args.memory_budget_mb,
+                                                                  args.geometric, args.line_first, reader, debug),
+                               worker_id=args.worker_id, batch_size=args.batch_size,
+                               lease_seconds=args.lease_seconds, idle_exit=not args.wait)
+        print(f"Completed {completed} jobs")
+        if debug is not None:
+            debug.close()
+            print(f"Debug images: {debug.stats}")
+        if reader is not None:
+            from amazon_ml.budget import print_budget_report
+
+            print_budget_report(reader.controller)
+    elif args.queue_command == 'requeue':
+        print(f"Re-queued {queue.requeue_expired()} expired leases")
+    elif args.queue_command == 'merge':
+        print(f"Wrote {queue.export(args.output_csv)} rows to {args.output_csv}")
+    print(queue.stats())
+    return 0
+
+
+def cmd_serve(args):
+    from amazon_ml.priors import load_prior_index
+    from amazon_ml.server import serve
+
+    serve(args.host, args.port, load_prior_index(args.priors) if args.priors else None, budgeted_reader(args))
+    return 0
+
+
+def cmd_loadtest(args):
+    import json
+    from amazon_ml import loadgen
+
+    requests = loadgen.load_request_log(args.log, args.limit)
+    if not requests:
+        print(f"No requests in {args.log}")
+        return 1
+    synthesized = loadgen.resolve_images(requests, args.image_dir, args.synthetic_dir)
+    print(f"{len(requests)} requests ({synthesized} with synthetic images)")
+
+    reader = None
+    if args.target == 'http':
+        call = loadgen.http_target(args.url)
+    elif args.target == 'inprocess':
+        from amazon_ml.priors import load_prior_index
+
+        reader = budgeted_reader(args)
+        call = loadgen.inprocess_target(load_prior_index(args.priors) if args.priors else None, reader)
+    else:
+        call = loadgen.noop_target()
+
+    summaries = []
+    if args.replay_timing:
+        summaries.append(loadgen.run_open_loop(requests, call, max_in_flight=args.max_in_flight, replay_timing=True))
+    for rate in args.rate or []:
+        summaries.append(loadgen.run_open_loop(requests, call, rate, args.max_in_flight))
+    for concurrency in args.concurrency or ([] if summaries else [1]):
+        summaries.append(loadgen.run_closed_loop(requests, call, concurrency))
+
+    loadgen.print_report(summaries, args.slo_p99_ms)
+    if reader is not None:
+        from amazon_ml.budget import print_budget_report
+
+        print_budget_report(reader.controller)
+    if args.json_out:
+        with open(args.json_out, 'w') as f:
+            json.dump(summaries, f, indent=2)
+    if args.slo_p99_ms is not None and any(s['p99_ms'] > args.slo_p99_ms for s in summaries):
+        return 1
+    return 0
+
+
+def cmd_download(args):
+    from amazon_ml.download import download_image_from_csv
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for i in range(args.count):
+        image, entity_name = download_image_from_csv(args.csv)
+        if not (image and entity_name):
+            break  # Exit the loop if no more images
+        path = os.path.join(args.out_dir, f"{i}_{entity_name}.{(image.format or 'jpg').lower()}")
+        image.save(path)
+        print(f"Entity Name: {entity_name} -> {path}")
+    return 0
+
+
+def cmd_visualize(args):
+    from amazon_ml.visualize import process_image
+
+    process_image(args.image, gpu=not args.cpu, out_dir=args.out_dir)
+    return 0
+
+
+def add_memory_budget_argument(parser):
+    parser.add_argument('--memory-budget-mb', type=float, default=None,
+                        help='OCR in overlapping tiles sized for this detector memory budget.')
+
+
+def add_priors_argument(parser, group_id=True):
+    parser.add_argument('--priors', help='Unit-prior index written by build-priors.')
+    if group_id:
+        parser.add_argument('--group-id', help="The image's group_id, for the unit prior lookup.")
+
+
+def add_latency_budget_argument(parser):
+    parser.add_argument('--latency-budget-ms', type=float,
+                        help='Per-image OCR latency budget; picks canvas size and magnification per image.')
+
+
+def budgeted_reader(args):
+    # A BudgetedReader over the shared OCR reader if --latency-budget-ms was given, else None.
+    if args.latency_budget_ms is None:
+        return None
+    from amazon_ml.budget import BudgetedReader, CanvasController
+    from amazon_ml.ocr import get_reader
+
+    return BudgetedReader(get_reader(), CanvasController(args.latency_budget_ms))
+
+
+def add_debug_arguments(parser, sample_rate):
+    parser.add_argument('--debug-dir', help='Render annotated detections here, off the detection path.')
+    parser.add_argument('--debug-sample-rate', type=float, default=sample_rate,
+                        help='Fraction of successful detections to render (failures are always rendered).')
+
+
+def debug_sink(args):
+    # A visualize.DebugSink if --debug-dir was given, else None.
+    if not args.debug_dir:
+        return None
+    from amazon_ml.visualize import DebugSink
+
+    return DebugSink(args.debug_dir, sample_rate=args.debug_sample_rate)
+
+
+def add_profile_argument(parser):
+    parser.add_argument('--no-profile', action='store_true',
+                        help="Use EasyOCR defaults instead of the entity's OCR profile.")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='amazon_ml', description='Entity value extraction from product images.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('extract', help='Run the regex extractor on a piece of text.')
+    p.add_argument('text')
+    p.set_defaults(func=cmd_extract)
+
+    p = sub.add_parser('detect', help='Detect a height/width/depth value in an image.')
+    p.add_argument('image')
+    p.add_argument('entity', choices=['height', 'width', 'depth'])
+    p.add_argument('--cpu', action='store_true', help='Run EasyOCR without a GPU.')
+    p.add_argument('--oriented', action='store_true',
+                   help='Also read vertical/upside-down labels, rotating only the boxes that need it.')
+    p.add_argument('--line-engine', default='hough', choices=['hough', 'lsd', 'fld', 'projection'],
+                   help='Line detector used to classify dimension lines.')
+    add_memory_budget_argument(p)
+    add_profile_argument(p)
+    add_debug_arguments(p, sample_rate=1.0)
+    p.set_defaults(func=cmd_detect)
+
+    p = sub.add_parser('dimensions', help='Height, width and depth candidates from one geometric pass.')
+    p.add_argument('image')
+    p.add_argument('--top', type=int, default=3)
+    p.add_argument('--line-engine', default='hough', choices=['hough', 'lsd', 'fld', 'projection'])
+    p.add_argument('--line-first', action='store_true',
+                   help='Find long lines first and only OCR the bands around them.')
+    p.set_defaults(func=cmd_dimensions)
+
+    p = sub.add_parser('ocr', help='OCR an image and extract one entity (voltage, wattage, ...).')
+    p.add_argument('image')
+    p.add_argument('entity')
+    add_memory_budget_argument(p)
+    add_profile_argument(p)
+    add_priors_argument(p)
+    p.set_defaults(func=cmd_ocr)
+
+    p = sub.add_parser('batch', help='OCR a directory of images and merge the results into a CSV.')
+    p.add_argument('input_csv')
+    p.add_argument('image_dir')
+    p.add_argument('output_csv')
+    add_memory_budget_argument(p)
+    add_profile_argument(p)
+    add_priors_argument(p, group_id=False)
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser('build-priors', help='Build the group_id unit-prior index from labelled CSVs.')
+    p.add_argument('--csv', action='append', help='Labelled CSV (repeatable). Defaults to the bundled sets.')
+    p.add_argument('--out', default='unit_priors.bin')
+    p.set_defaults(func=cmd_build_priors)
+
+    p = sub.add_parser('queue', help='Shared SQLite job queue: init, work, status, requeue, merge.')
+    p.add_argument('db', help='SQLite queue file (created on first use).')
+    p.add_argument('--shared-fs', action='store_true',
+                   help='The file is shared by several machines over a network filesystem.')
+    queue_sub = p.add_subparsers(dest='queue_command', required=True)
+    q = queue_sub.add_parser('init', help='Queue every row of a CSV (test.csv layout).')
+    q.add_argument('csv')
+    q = queue_sub.add_parser('work', help='Claim and process jobs until none are left.')
+    q.add_argument('--worker-id', help='Defaults to host:pid.')
+    q.add_argument('--batch-size', type=int, default=8)
+    q.add_argument('--lease-seconds', type=float, default=300)
+    q.add_argument('--wait', action='store_true', help="Keep polling for other workers' expired leases.")
+    q.add_argument('--geometric', action='store_true',
+                   help='Answer height/width/depth from one shared geometric analysis per image.')
+    q.add_argument('--line-first', action='store_true',
+                   help='Like --geometric, but only OCR the bands around detected dimension lines.')
+    add_memory_budget_argument(q)
+    add_latency_budget_argument(q)
+    add_debug_arguments(q, sample_rate=0.01)
+    add_priors_argument(q, group_id=False)
+    queue_sub.add_parser('status', help='Show job counts by status.')
+    queue_sub.add_parser('requeue', help='Return expired leases to the pool.')
+    q = queue_sub.add_parser('merge', help='Export results to the submission CSV in index order.')
+    q.add_argument('output_csv')
+    p.set_defaults(func=cmd_queue)
+
+    p = sub.add_parser('serve', help='Serve predictions over a local HTTP endpoint (POST /predict).')
+    p.add_argument('--host', default='127.0.0.1')
+    p.add_argument('--port', type=int, default=8000)
+    add_latency_budget_argument(p)
+    add_priors_argument(p, group_id=False)
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser('loadtest', help='Replay a JSONL request log and report throughput vs latency.')
+    p.add_argument('log', help='JSONL with image (path or image_link), entity_name, optional group_id/timestamp.')
+    p.add_argument('--target', choices=['inprocess', 'http', 'noop'], default='inprocess')
+    p.add_argument('--url', default='http://127.0.0.1:8000/predict')
+    p.add_argument('--image-dir', help='Local cache of images, looked up by basename.')
+    p.add_argument('--synthetic-dir', help='Generate synthetic images here for requests with no local image.')
+    p.add_argument('--limit', type=int)
+    p.add_argument('--rate', type=float, action='append', help='Open-loop arrivals per second (repeatable).')
+    p.add_argument('--replay-timing', action='store_true', help="Open loop at the log's own timestamps.")
+    p.add_argument('--concurrency', type=int, action='append', help='Closed-loop clients (repeatable).')
+    p.add_argument('--max-in-flight', type=int, default=64, help='Open-loop worker threads.')
+    p.add_argument('--slo-p99-ms', type=float, help='Exit non-zero if any run misses this p99.')
+    p.add_argument('--json-out')
+    add_latency_budget_argument(p)
+    add_priors_argument(p, group_id=False)
+    p.set_defaults(func=cmd_loadtest)
+
+    p = sub.add_parser('download', help='Download the next images listed in a CSV.')
+    p.add_argument('csv')
+    p.add_argument('--count', type=int, default=5)
+    p.add_argument('--out-dir', default='downloads')
+    p.set_defaults(func=cmd_download)
+
+    p = sub.add_parser('visualize', help='Render every detection step for one image to an annotated PNG.')
+    p.add_argument('image')
+    p.add_argument('--out-dir', default='debug')
+    p.add_argument('--cpu', action='store_true', help='Run EasyOCR without a GPU.')
+    p.set_defaults(func=cmd_visualize)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -1,8 +1,11 @@
 import cv2
 import numpy as np
-import easyocr
-import matplotlib.pyplot as plt
-import numbers
+
+from amazon_ml.lines import DEFAULT_ENGINE, detect_lines, require_engine
+from amazon_ml.ocr import get_reader
+from amazon_ml.orientation import OrientedReader
+from amazon_ml.profiles import get_profile
+from amazon_ml.tiling import readtext_tiled
 
 # ----------------------------------------------------------
 # Calculate Line Angle (x1,y1,x2,y2) -> Angle
@@ -14,33 +17,31 @@ def calculate_line_angle(x1, y1, x2, y2):
     return angle
 
 # ----------------------------------------------------------
-# Calculate Line Angle (x1,y1,x2,y2) -> Angle
+# Classify ROI by its lines -> 'width' / 'height' / None
 # ----------------------------------------------------------
-def classify_line(image, entity):
+def classify_line(image, entity=None, threshold=50, min_line_length=30, max_line_gap=5, engine=DEFAULT_ENGINE):
     # Classify lines as horizontal (width) or vertical (height).
+    # With entity=None the first horizontal or vertical line decides the class.
+    # `engine` picks the line detector (see amazon_ml.lines); threshold/max_line_gap only apply to Hough.
     print(f"Classifying entities by line in the cropped region, entity check for: {entity}")
     try:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-        edges = cv2.Canny(blurred, 50, 150)
-        
-        # lines = cv2.HoughLinesP(edges, 1, np.pi / 180, threshold=100, minLineLength=100, maxLineGap=10)
-        lines = cv2.HoughLinesP(edges, 1, np.pi / 180, threshold=50, minLineLength=30, maxLineGap=5)
+        lines = detect_lines(image, engine, threshold=threshold,
+                             min_line_length=min_line_length, max_line_gap=max_line_gap)
 
-        if lines is None:
+        if not lines:
             print(f"No lines detected in image.")
             return None
         
         print(f"Total lines detected: {len(lines)}")
         for line in lines:
-            x1, y1, x2, y2 = line[0]
+            x1, y1, x2, y2 = line
             angle = calculate_line_angle(x1, y1, x2, y2)
 
-            if entity == 'width':
+            if entity in ('width', None):
                 if -15 <= angle <= 15:
                     print(f"Horizontal line detected with angle: {angle}. Classified as width.")
                     return 'width'
-            elif entity == 'height':
+            if entity in ('height', None):
                 if 75 <= abs(angle) <= 105:
                     print(f"Vertical line detected with angle: {angle}. Classified as height.")
                     return 'height'
@@ -90,55 +91,46 @@ def contains_numbers(text):
     print(f"Text '{text}' contains numbers: {result}")
     return result
 
-def draw_bounding_boxes(image, boxes, color=(0, 255, 0)):
-    #Draw bounding boxes on the image.
-    print(f"Drawing {len(boxes)} bounding boxes.")
-    try:
-        for box in boxes:
-            box = np.array(box, dtype=np.int32)
-            cv2.polylines(image, [box], isClosed=True, color=color, thickness=2)
-        return image
-    except Exception as e:
-        print(f"Error in draw_bounding_boxes: {e}")
-        return image
-
-def display_image(image, title="Image"):
-    """Display an image using matplotlib."""
-    print(f"Displaying image with title: {title}")
-    try:
-        plt.imshow(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
-        plt.title(title)
-        plt.axis('off')
-        plt.show()
-    except Exception as e:
-        print(f"Error in display_image: {e}")
-
-def detect_entity_in_image(image_path, entity):
+def detect_entity_in_image(image_path, entity, gpu=True, memory_budget_mb=None, oriented=False, use_profile=True,
+                           engine=DEFAULT_ENGINE, results=None, reader=None, debug=None):
+    # `debug` is an optional visualize.DebugSink; it receives a DetectionRecord and does any drawing off-thread.
+    require_engine(engine)
+    profile = get_profile(entity) if use_profile else {}
     if entity == 'depth':
         entity = 'width'
         
     print(f"\nStarting detection process for entity: {entity} \n")
     try:
-        # Initialize EasyOCR reader
-        reader = easyocr.Reader(['en'], gpu=True)  # gpu=False if you're not using GPU
-
-        # Load image
-        image = cv2.imread(image_path)
+        # Load image (or use an already decoded one)
+        image = image_path if isinstance(image_path, np.ndarray) else cv2.imread(image_path)
         if image is None:
             print(f"Failed to load image from path: {image_path}")
             return None
         # ----------------------------------------------------------
-        # Step 1: Detect all texts and show original bounding boxes
+        # Step 1: Detect all texts
         # ----------------------------------------------------------
 
-        results = reader.readtext(image)
+        # OCR results may be passed in to re-run only the line classification
+        if results is None:
+            # Shared EasyOCR reader, built once per process (or a wrapper such as BudgetedReader)
+            reader = reader or get_reader(gpu=gpu)  # gpu=False if you're not using GPU
+            if oriented:
+                # Rotated recognition only for boxes that look vertical or flipped
+                reader = OrientedReader(reader)
+
+            if memory_budget_mb is not None:
+                results = readtext_tiled(image, reader, memory_budget_mb, **profile)
+            else:
+                results = reader.readtext(image, **profile)
 
         # Debug: Check if results are empty
         if results:
             print(f"\nResults detected: {results}\n")
         else:
             print("No text found in the image.")
-            return None, results
+            if debug is not None:
+                debug.emit(_debug_record(image_path, image, entity, [], [], [], [], None, None))
+            return None
         
         # Number of boxes
         all_bboxes = [r[0] for r in results]
@@ -146,11 +138,9 @@ def detect_entity_in_image(image_path, entity):
 
         # Define length and height of image
         image_height, image_width = image.shape[:2]
-        image_copy = image.copy()
-
-
-
-        display_image(draw_bounding_boxes(image.copy(), all_bboxes), "All Bounding Boxes")
+        result = None
+        found_entity = False
+        labels = []
 
         # ----------------------------------------------------------
         # Step 2: Filter for number-containing text
@@ -164,9 +154,6 @@ def detect_entity_in_image(image_path, entity):
 
         print(f"Total number of number-containing text blocks: {len(number_bboxes)}")
 
-        # Display only the bounding boxes which contain numbers
-        display_image(draw_bounding_boxes(image.copy(), number_bboxes, color=(255, 0, 0)), "Bounding Boxes with Numbers")
-
         # ----------------------------------------------------------
         # Step 3: Extend bounding boxes by 50px
         # ----------------------------------------------------------
@@ -174,9 +161,6 @@ def detect_entity_in_image(image_path, entity):
         extended_bboxes = [extend_bounding_box(bbox, image_width, image_height, extend_px=50) for bbox in number_bboxes]
         print(f"Extended bounding boxes: {extended_bboxes}")
 
-        display_image(draw_bounding_boxes(image.copy(), extended_bboxes, color=(0, 0, 255)), "Extended Bounding Boxes by 50px")
-
-    
         # ----------------------------------------------------------
         # Step 4: Process text regions and classify them
         # ----------------------------------------------------------
@@ -206,30 +190,25 @@ def detect_entity_in_image(image_path, entity):
                 # Step 4.4: Classify the extracted ROI based on the entity (width or height)
                 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-                classification_result = classify_line(roi, entity)
-
+                classification_result = classify_line(roi, entity, engine=engine)
+                labels.append((extended_bbox, text, classification_result))
 
                 if classification_result == entity:
                     print(f"Match found: Detected {entity} for '{text}'")
                     result = text
                     found_entity = True
-
-                    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-                    # Step 4.6: Annotate the image with the classification result
-                    # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-
-                    cv2.putText(image_copy, classification_result, (x_min, y_min - 10),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
                 else:
                     print(f"Entity not matching for '{text}'. Classification result: {classification_result}")
             except Exception as e:
                 print(f"Error processing ROI for text '{text}': {e}")
 
         # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
-        # Step 4.7: Display the final image with annotations
+        # Step 4.7: Hand the annotations to the debug sink, if any
         # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-        display_image(image_copy, f"Final Classification: {entity.capitalize()}")
+        if debug is not None:
+            debug.emit(_debug_record(image_path, image, entity, all_bboxes, number_bboxes, extended_bboxes,
+                                     labels, result, None))
 
         if not found_entity:
             print(f"No '{entity}' found in the image.")
@@ -243,18 +222,16 @@ def detect_entity_in_image(image_path, entity):
 
     except Exception as e:
         print(f"Error in detect_entity_in_image: {e}")
+        if debug is not None:
+            debug.emit(_debug_record(image_path, None, entity, [], [], [], [], None, str(e)))
         return None
 
 
-image_path = '/Users/ericvaish/Downloads/Amazon/Height_2500/41XM9J3d5SL.jpg'
-entity = 'height'  # entity type: 'height' or 'width'
-
-result = detect_entity_in_image(image_path, entity)
-
-print("----------")
-print(f"Detected entity: {result}")
-print("----------")
-
-
-
+def _debug_record(image_path, image, entity, *fields):
+    # Imported here so the detection path does not load the visualization module unless debugging.
+    from amazon_ml.visualize import DetectionRecord
 
+    key = None if isinstance(image_path, np.ndarray) else image_path
+    if image is None and isinstance(image_path, np.ndarray):
+        image = image_path
+    return DetectionRecord(key, entity, image, *fields)
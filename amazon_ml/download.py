@@ -1,12 +1,21 @@
+import os
+from io import BytesIO
+
 import pandas as pd
 import requests
 from PIL import Image
-from io import BytesIO
-import os
 
 # Initialize a global variable to track the current row index
 current_row_index = 0
 
+
+def download_image(image_url, timeout=30):
+    # Download one image and open it with PIL; raises on HTTP errors.
+    response = requests.get(image_url, timeout=timeout)
+    response.raise_for_status()  # Raise error if the HTTP request failed
+    return Image.open(BytesIO(response.content))
+
+
 def download_image_from_csv(csv_file):
     """
     Downloads the next image from the CSV and removes the row after downloading.
@@ -39,11 +48,7 @@ def download_image_from_csv(csv_file):
         entity_name = selected_row['entity_name']
 
         # Download the image from the URL
-        response = requests.get(image_url)
-        response.raise_for_status()  # Raise error if the HTTP request failed
-
-        # Open the image using PIL
-        image = Image.open(BytesIO(response.content))
+        image = download_image(image_url)
 
         # Print for feedback (optional)
         print(f"Successfully downloaded image for {entity_name} from {image_url}")
@@ -69,18 +74,3 @@ def download_image_from_csv(csv_file):
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
         return None, None
-
-
-# Example usage:
-csv_file_path = '/Users/ericvaish/Downloads/student_resource 3/dataset/test_copy.csv'
-
-# Call the helper function multiple times
-for _ in range(5):  # Simulate repeated calls
-    image, entity_name = download_image_from_csv(csv_file_path)
-
-    # Display the image and entity name if available
-    if image and entity_name:
-        image.show()  # This will open the image in a default image viewer
-        print(f"Entity Name: {entity_name}")
-    else:
-        break  # Exit the loop if no more images
@@ -0,0 +1,242 @@
+import math
+import re
+
+# ----------------------------------------------------------
+# Regex / unit normalization layer.
+#
+# This module only depends on the standard library so that it can be
+# imported (and reused by workers, tests and the CLI) in milliseconds,
+# without pulling in OpenCV, EasyOCR or torch.
+# ----------------------------------------------------------
+
+# Define patterns for each entity, including both long and short forms
+PATTERNS = {
+    'weight': r'(\d+\.?\d*)\s?(g|kg|microgram|mg|milligram|mcg|ounce|oz|pound|lb|ton|grams|kilogram|kilograms|milligrams|micrograms|pounds|tons)',
+    'height': r'(\d+\.?\d*)\s?(cm|mm|m|ft|foot|inch|inches|metre|yard|yards|centimetre|millimetre|metre)',
+    'width': r'(\d+\.?\d*)\s?(cm|mm|m|ft|foot|inch|inches|metre|yard|yards|centimetre|millimetre|metre)',
+    'depth': r'(\d+\.?\d*)\s?(cm|mm|m|ft|foot|inch|inches|metre|yard|yards|centimetre|millimetre|metre)',
+    'voltage': r'(\d+\.?\d*-\d+\.?\d*|\d+\.?\d*)\s?(v|kv|volt|volts|kilovolt|millivolt)',
+    'wattage': r'(\d+\.?\d*)\s?(w|kw|watt|watts|kilowatt)',
+    'volume': r'(\d+\.?\d*)\s?(ml|l|litre|litres|millilitre|millilitres|centilitre|cl|cubic foot|cubic inch|cup|decilitre|dl|fluid ounce|oz|gallon|imperial gallon|pint|quart)'
+}
+
+_COMPILED_PATTERNS = {key: re.compile(pattern, re.IGNORECASE) for key, pattern in PATTERNS.items()}
+
+# Map the `entity_name` values used in the dataset CSVs onto the pattern keys above
+ENTITY_ALIASES = {
+    'item_weight': 'weight',
+    'maximum_weight_recommendation': 'weight',
+    'item_volume': 'volume',
+}
+
+# Extended unit mapping, all units are in singular form
+UNIT_MAPPING = {
+    'v': 'volt',
+    'kv': 'kilovolt',
+    'mv': 'millivolt',
+    'w': 'watt',
+    'kw': 'kilowatt',
+    'ml': 'millilitre',
+    'l': 'litre',
+    'cl': 'centilitre',
+    'microlitre': 'microlitre',
+    'cubic foot': 'cubic foot',
+    'cubic inch': 'cubic inch',
+    'cup': 'cup',
+    'dl': 'decilitre',
+    'fluid ounce': 'fluid ounce',
+    'gallon': 'gallon',
+    'imperial gallon': 'imperial gallon',
+    'pint': 'pint',
+    'quart': 'quart',
+    'g': 'gram',
+    'kg': 'kilogram',
+    'mg': 'milligram',
+    'mcg': 'microgram',
+    'lb': 'pound',
+    'oz': 'ounce',
+    'ton': 'ton',
+    'cm': 'centimetre',
+    'mm': 'millimetre',
+    'm': 'metre',
+    'ft': 'foot',
+    'inch': 'inch',
+    'yard': 'yard'
+}
+
+_FULL_UNITS = set(UNIT_MAPPING.values()) | {'centimetre', 'millimetre', 'metre', 'millilitre', 'litre'}
+
+# Unit spellings the patterns accept that are neither short forms nor plurals
+_UNIT_SPELLINGS = {'in': 'inch', 'feet': 'foot', 'yards': 'yard'}
+
+# Candidates more than this many orders of magnitude outside a prior's
+# p5..p95 range for their unit are rejected as implausible.
+MAGNITUDE_SLACK = 1.0
+
+_VALUE_UNIT = re.compile(r'(\d+\.?\d*)\s*([a-zA-Z]+)')
+
+
+def normalize_entity_name(entity_name):
+    # Turn a CSV `entity_name` (e.g. 'item_weight') into a pattern key (e.g. 'weight').
+    return ENTITY_ALIASES.get(entity_name, entity_name)
+
+
+def canonical_unit(unit):
+    # Map an OCR'd unit token ('cm', 'Inches', 'V') onto the dataset's unit names ('centimetre', ...).
+    unit = unit.lower().strip()
+    unit = _UNIT_SPELLINGS.get(unit, UNIT_MAPPING.get(unit, unit))
+    if unit not in _FULL_UNITS:
+        if unit.endswith('es') and unit[:-2] in _FULL_UNITS:
+            return unit[:-2]
+        if unit.endswith('s') and unit[:-1] in _FULL_UNITS:
+            return unit[:-1]
+    return unit
+
+
+def _plausible(value, low, high):
+    if value <= 0:
+        return False
+    magnitude = math.log10(value)
+    return low - MAGNITUDE_SLACK <= magnitude <= high + MAGNITUDE_SLACK
+
+
+def rank_by_prior(candidates, prior):
+    """
+    Narrow (value, unit) candidates with a `priors.UnitPrior`.
+
+    The prior's units are tried most likely first and the first unit with a
+    plausible value wins; values far outside that unit's magnitude range are
+    dropped. When no unit has a plausible value, only candidates in units the
+    prior has no range for are kept (possibly none).
+    """
+    by_unit = {}
+    for value, unit in candidates:
+        by_unit.setdefault(canonical_unit(unit), []).append(value)
+    for unit, share, low, high in prior.units:
+        values = [value for value in by_unit.get(unit, ()) if _plausible(value, low, high)]
+        if values:
+            return [(value, unit) for value in values]
+    known = {unit for unit, *_ in prior.units}
+    return [(value, unit) for value, unit in candidates if canonical_unit(unit) not in known]
+
+
+def _candidates(text, key):
+    # (value, unit) pairs for one pattern key, in text order
+    pattern = _COMPILED_PATTERNS.get(key)
+    candidates = []
+    for value, unit in (pattern.findall(text) if pattern is not None else []):
+        if '-' in value:  # Handle range (e.g., "100-240V")
+            start, end = value.split('-')
+            candidates.extend([(float(start), unit), (float(end), unit)])
+        else:
+            candidates.append((float(value), unit))
+    return candidates
+
+
+def extract_info(text, entity_name=None, prior=None):
+    """
+    Extract sorted numeric values for each entity from OCR text.
+
+    Args:
+        text (str): The text returned by the OCR reader.
+        entity_name (str, optional): Only return the values for this entity.
+        prior (priors.UnitPrior, optional): Unit/magnitude prior for
+            `entity_name`'s group; keeps only values in the likeliest unit.
+
+    Returns:
+        dict: entity -> sorted list of floats (or 'Not found'), or the value
+        for `entity_name` alone when it is given.
+    """
+    keys = PATTERNS.keys() if entity_name is None else [normalize_entity_name(entity_name)]
+
+    extracted_data = {}
+
+    # Iterate over each entity and apply the pattern
+    for key in keys:
+        candidates = _candidates(text, key)
+        if candidates and prior is not None and entity_name is not None:
+            candidates = rank_by_prior(candidates, prior)
+        if candidates:
+            extracted_values = [value for value, unit in candidates]
+            # Sort the values
+            sorted_values = sorted(extracted_values)
+            extracted_data[key] = sorted_values
+        else:
+            extracted_data[key] = 'Not found'
+
+    if entity_name is not None:
+        return extracted_data[normalize_entity_name(entity_name)]
+    return extracted_data
+
+
+def format_prediction(text, entity_name, prior=None):
+    """
+    Turn OCR text into a submission value such as '12.0 centimetre'.
+
+    Takes the first candidate in text order (after prior re-ranking);
+    returns '' when nothing matches.
+    """
+    candidates = _candidates(text, normalize_entity_name(entity_name))
+    if prior is not None:
+        candidates = rank_by_prior(candidates, prior)
+    if not candidates:
+        return ''
+    value, unit = candidates[0]
+    return f"{value} {canonical_unit(unit)}"
+
+
+def process_units(input_list, prior=None):
+    # Extract and process the units from the input list
+    values = []
+    unit = None
+
+    matches = [_VALUE_UNIT.match(item) for item in input_list]
+    matches = [(float(match.group(1)), match.group(2).lower()) for match in matches if match]
+
+    # With a prior, keep the likeliest unit (and plausible values) instead of the first one seen
+    if prior is not None:
+        matches = rank_by_prior(matches, prior)
+
+    for value, current_unit in matches:
+        if unit is None:
+            unit = current_unit
+
+        # Only add to list if the unit matches the first unit encountered
+        if current_unit == unit:
+            values.append(value)
+
+    # Convert the unit to its full form
+    full_unit = UNIT_MAPPING.get(unit, unit)
+
+    # Sort values in ascending order
+    values.sort()
+
+    # Return the sorted list and the unit
+    return values, full_unit
+
+
+def parse_entity_value(entity_value):
+    """
+    Parse a labelled `entity_value` from the dataset CSVs.
+
+    Args:
+        entity_value (str): e.g. '46.5 millimetre' or '[100.0, 240.0] volt'.
+
+    Returns:
+        tuple: (list of floats, unit str), or ([], None) if it cannot be parsed.
+    """
+    if not isinstance(entity_value, str):
+        return [], None
+    entity_value = entity_value.strip()
+    if entity_value.startswith('['):
+        numbers, _, unit = entity_value[1:].partition(']')
+        try:
+            values = [float(v) for v in numbers.split(',') if v.strip()]
+        except ValueError:
+            return [], None
+        return values, unit.strip() or None
+    number, _, unit = entity_value.partition(' ')
+    try:
+        return [float(number)], unit.strip() or None
+    except ValueError:
+        return [], None
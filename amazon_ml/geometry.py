@@ -0,0 +1,184 @@
+from collections import OrderedDict, namedtuple
+
+import cv2
+import numpy as np
+
+from amazon_ml.dimensions import contains_numbers
+from amazon_ml.lines import DEFAULT_ENGINE, detect_lines
+from amazon_ml.ocr import get_reader
+from amazon_ml.profiles import get_profile
+from amazon_ml.tiling import readtext_tiled
+
+# ----------------------------------------------------------
+# Single-pass geometric analysis: height, width and depth together.
+#
+# `detect_entity_in_image` answers one orientation per call, so getting all
+# three dimensions costs three OCR + line passes. Here the image is OCR'd
+# once, lines are detected once over the whole image, and every numeric
+# text box is associated with the nearby dimension lines:
+#   vertical lines   -> height
+#   horizontal lines -> width (and depth, at a lower score)
+#   oblique lines    -> depth (the receding edge in a 3/4 product view)
+# ----------------------------------------------------------
+
+DIMENSIONS = ('height', 'width', 'depth')
+
+# Horizontal-line associations also count for depth, scaled by this.
+DEPTH_FROM_HORIZONTAL = 0.5
+
+# text: OCR text, score: 0..1, bbox: OCR box, line: (x1, y1, x2, y2)
+DimensionCandidate = namedtuple('DimensionCandidate', ['text', 'score', 'bbox', 'line'])
+
+
+def line_orientations(lines):
+    # 'horizontal', 'vertical' or 'oblique' per segment, using the tolerances of classify_line.
+    angles = np.abs(np.degrees(np.arctan2(lines[:, 3] - lines[:, 1], lines[:, 2] - lines[:, 0])))
+    return np.select([(angles <= 15) | (angles >= 165), (angles >= 75) & (angles <= 105)],
+                     ['horizontal', 'vertical'], 'oblique')
+
+
+def _segment_distances(point, segments):
+    # Distance from a point to every segment, and where along each segment it projects (0..1).
+    p = np.asarray(point, dtype=np.float32)
+    a, b = segments[:, :2], segments[:, 2:]
+    ab = b - a
+    length_sq = np.maximum((ab ** 2).sum(axis=1), 1e-6)
+    t = ((p - a) * ab).sum(axis=1) / length_sq
+    closest = a + np.clip(t, 0, 1)[:, None] * ab
+    return np.sqrt(((p - closest) ** 2).sum(axis=1)), t
+
+
+def analyze_dimensions(image, results=None, reader=None, engine=DEFAULT_ENGINE, min_line_length=None,
+                       max_distance=None, segments=None, memory_budget_mb=None, image_key=None, debug=None):
+    """
+    Assign every numeric text box to its nearest dimension line(s) in one pass.
+
+    Args:
+        image (np.ndarray): BGR image.
+        results (list, optional): EasyOCR results to reuse instead of running OCR.
+        engine (str): Line engine from amazon_ml.lines.
+        min_line_length (int, optional): Defaults to 5% of the shorter image side.
+        max_distance (float, optional): Farthest a label's nearest corner may sit
+            from its line; defaults to twice the label height (at least 50px).
+        segments (list, optional): Line segments to reuse instead of detecting them.
+        memory_budget_mb (float, optional): OCR in tiles under this detector memory budget.
+        image_key (str, optional): Path or link of the image, naming its debug record.
+        debug (visualize.DebugSink, optional): Receives one detection record per analysis.
+
+    Returns:
+        dict: 'height', 'width' and 'depth' -> DimensionCandidate list, best first.
+    """
+    if results is None:
+        reader = reader or get_reader()
+        if memory_budget_mb is not None:
+            results = readtext_tiled(image, reader, memory_budget_mb, **get_profile('height'))
+        else:
+            results = reader.readtext(image, **get_profile('height'))
+
+    image_height, image_width = image.shape[:2]
+    min_line_length = min_line_length or max(30, int(0.05 * min(image_height, image_width)))
+    if segments is None:
+        segments = detect_lines(image, engine, min_line_length=min_line_length)
+
+    candidates = {dimension: [] for dimension in DIMENSIONS}
+    if not segments:
+        if debug is not None:
+            debug.emit(_debug_record(image_key, image, results, candidates))
+        return candidates
+
+    lines = np.array(segments, dtype=np.float32)
+    orientations = line_orientations(lines)
+    lengths = np.hypot(lines[:, 2] - lines[:, 0], lines[:, 3] - lines[:, 1])
+    # Longer lines are more likely to be the dimension arrow than texture.
+    length_weight = 0.5 + 0.5 * np.minimum(1.0, lengths / (0.5 * max(image_height, image_width)))
+
+    for bbox, text, prob in results:
+        if not contains_numbers(text):
+            continue
+        points = np.array(bbox, dtype=np.float32)
+        center = points.mean(axis=0)
+        box_height = points[:, 1].max() - points[:, 1].min()
+        reach = max_distance or max(50.0, 2 * box_height)
+
+        # Measure from the nearest corner of the label, not its centre: a wide label beside
+        # a line has its centre half its width away. The centre still decides where along
+        # the line the label sits.
+        _, t = _segment_distances(center, lines)
+        distances = np.min([_segment_distances(corner, lines)[0] for corner in points], axis=0)
+        # The label must sit beside the line, not far beyond either end.
+        nearby = (distances <= reach) & (t >= -0.1) & (t <= 1.1)
+        scores = np.where(nearby, prob * np.exp(-distances / reach) * length_weight, 0.0)
+
+        text = text.replace(",", ".")
+        for orientation, dimensions in (('vertical', (('height', 1.0),)),
+                                        ('horizontal', (('width', 1.0), ('depth', DEPTH_FROM_HORIZONTAL))),
+                                        ('oblique', (('depth', 1.0),))):
+            mask = orientations == orientation
+            if not (mask & nearby).any():
+                continue
+            best = int(np.argmax(np.where(mask, scores, -1.0)))
+            for dimension, weight in dimensions:
+                candidates[dimension].append(DimensionCandidate(
+                    text, float(scores[best] * weight), bbox, tuple(int(v) for v in segments[best])))
+
+    for dimension in DIMENSIONS:
+        candidates[dimension].sort(key=lambda candidate: candidate.score, reverse=True)
+    if debug is not None:
+        debug.emit(_debug_record(image_key, image, results, candidates))
+    return candidates
+
+
+def _debug_record(image_key, image, results, candidates):
+    # All OCR boxes, the numeric ones, and each dimension's best label with its line.
+    from amazon_ml.visualize import DetectionRecord
+
+    best = {dimension: found[0] for dimension, found in candidates.items() if found}
+    labels = [(candidate.bbox, candidate.text, dimension) for dimension, candidate in best.items()]
+    result = ', '.join(f"{dimension}={candidate.text}" for dimension, candidate in best.items()) or None
+    return DetectionRecord(image_key, 'dimensions', image, [r[0] for r in results],
+                           [r[0] for r in results if contains_numbers(r[1])], [], labels, result, None)
+
+
+class AnalysisCache:
+    """
+    Small LRU of `analyze_dimensions` results keyed by image path or link,
+    so requests for height, width and depth of one image share a single run.
+    """
+
+    def __init__(self, max_size=32, analyzer=analyze_dimensions):
+        self.max_size = max_size
+        self.analyzer = analyzer
+        self._entries = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, image=None, **kwargs):
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        if image is None:
+            image = cv2.imread(key)
+            if image is None:
+                print(f"Failed to load image from path: {key}")
+                return {dimension: [] for dimension in DIMENSIONS}
+        analysis = self.analyzer(image, **kwargs)
+        self._entries[key] = analysis
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return analysis
+
+
+_cache = AnalysisCache()
+
+
+def is_cached(key, cache=None):
+    # True when `detect_dimension(key, ...)` needs no image.
+    return key in (cache or _cache)
+
+
+def detect_dimension(key, entity, image=None, cache=None, **kwargs):
+    # Best text for one dimensional entity, reusing the cached analysis of `key`.
+    analysis = (cache or _cache).get(key, image, **kwargs)
+    found = analysis.get(entity) or []
+    return found[0].text if found else None
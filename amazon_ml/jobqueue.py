@@ -0,0 +1,221 @@
+import csv
+import os
+import socket
+import sqlite3
+import time
+from collections import namedtuple
+
+# ----------------------------------------------------------
+# Durable work queue in a local SQLite file.
+#
+# Each CSV row becomes a job keyed by its `index`. Workers (processes on
+# one machine, or several machines sharing the file) claim batches inside
+# a write transaction, so no row is handed out twice. A claimed row holds a
+# lease that the worker renews while it is busy. A crashed worker's lease
+# simply expires and the row goes back to the pool, until
+# `max_attempts` is exhausted.
+# ----------------------------------------------------------
+
+PENDING, LEASED, DONE, FAILED = 'pending', 'leased', 'done', 'failed'
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+
+Job = namedtuple('Job', ['id', 'image_link', 'group_id', 'entity_name', 'attempts'])
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    image_link TEXT NOT NULL,
+    group_id TEXT,
+    entity_name TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    updated REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires);
+"""
+
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """
+    SQLite-backed job queue with leases.
+
+    Args:
+        path (str): SQLite file; created on first use.
+        shared_fs (bool): The file lives on a network filesystem shared by
+            several machines. WAL needs shared memory on one host, so the
+            rollback journal is used instead.
+        timeout (float): Seconds to wait for another writer's lock.
+    """
+
+    def __init__(self, path, shared_fs=False, timeout=60, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        # Autocommit mode; transactions are opened explicitly with BEGIN IMMEDIATE.
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._conn.execute(f"PRAGMA journal_mode={'DELETE' if shared_fs else 'WAL'}")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def _transaction(self):
+        return _Transaction(self._conn)
+
+    def enqueue_csv(self, csv_path):
+        # Add every CSV row as a pending job; rows already queued are left untouched.
+        with open(csv_path, newline='') as f:
+            reader = csv.DictReader(f)
+            rows = [(int(row['index']) if 'index' in row else i, row['image_link'], row.get('group_id'),
+                     row['entity_name'], time.time())
+                    for i, row in enumerate(reader)]
+        with self._transaction():
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO jobs (id, image_link, group_id, entity_name, updated) VALUES (?, ?, ?, ?, ?)",
+                rows)
+            return self._conn.total_changes - before
+
+    def claim(self, worker_id, batch_size=8, lease_seconds=DEFAULT_LEASE_SECONDS):
+        """
+        Atomically lease up to `batch_size` jobs to `worker_id`.
+
+        Pending jobs and jobs whose lease has expired are eligible, lowest
+        index first.
+        """
+        now = time.time()
+        with self._transaction():
+            # Leases that expired on their last attempt are given up on.
+            self._conn.execute("UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, updated = ? "
+                               "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                               (FAILED, now, LEASED, now, self.max_attempts))
+            rows = self._conn.execute(
+                "SELECT id, image_link, group_id, entity_name, attempts FROM jobs "
+                "WHERE (status = ? OR (status = ? AND lease_expires < ?)) AND attempts < ? "
+                "ORDER BY id LIMIT ?",
+                (PENDING, LEASED, now, self.max_attempts, batch_size)).fetchall()
+            self._conn.executemany(
+                "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated = ? WHERE id = ?",
+                [(LEASED, worker_id, now + lease_seconds, now, row[0]) for row in rows])
+        return [Job(*row[:4], row[4] + 1) for row in rows]
+
+    def renew(self, worker_id, job_ids, lease_seconds=DEFAULT_LEASE_SECONDS):
+        # Extend the leases this worker still holds; returns how many were renewed.
+        if not job_ids:
+            return 0
+        now = time.time()
+        with self._transaction():
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "UPDATE jobs SET lease_expires = ?, updated = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                [(now + lease_seconds, now, job_id, LEASED, worker_id) for job_id in job_ids])
+            return self._conn.total_changes - before
+
+    def complete(self, worker_id, job_id, result):
+        # Store a result; False if the lease was lost (the job was re-queued to someone else).
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = NULL, lease_owner = NULL, lease_expires = NULL, "
+                "updated = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (DONE, result, time.time(), job_id, LEASED, worker_id))
+            return cursor.rowcount == 1
+
+    def fail(self, worker_id, job_id, error):
+        # Release a job after an error; it is retried until max_attempts, then marked failed.
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, error = ?, "
+                "lease_owner = NULL, lease_expires = NULL, updated = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (self.max_attempts, PENDING, FAILED, str(error), time.time(), job_id, LEASED, worker_id))
+            return cursor.rowcount == 1
+
+    def requeue_expired(self):
+        # Put expired leases back to pending (claim() also picks them up on its own).
+        with self._transaction():
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, "
+                "lease_owner = NULL, lease_expires = NULL, updated = ? WHERE status = ? AND lease_expires < ?",
+                (self.max_attempts, PENDING, FAILED, time.time(), LEASED, time.time()))
+            return cursor.rowcount
+
+    def stats(self):
+        return dict(self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def export(self, out_csv):
+        # Write `index,prediction` in index order; unfinished rows get an empty prediction.
+        rows = self._conn.execute("SELECT id, CASE WHEN status = ? THEN result ELSE '' END FROM jobs ORDER BY id",
+                                  (DONE,))
+        count = 0
+        with open(out_csv, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['index', 'prediction'])
+            for job_id, result in rows:
+                writer.writerow([job_id, result or ''])
+                count += 1
+        return count
+
+
+class _Transaction:
+    # BEGIN IMMEDIATE takes the write lock up front so two claimers cannot pick the same rows.
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self._conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
+
+
+def run_worker(queue, handler, worker_id=None, batch_size=8, lease_seconds=DEFAULT_LEASE_SECONDS,
+               idle_exit=True, poll_seconds=5):
+    """
+    Claim and process jobs until the queue is drained.
+
+    Args:
+        queue (JobQueue): The shared queue.
+        handler (callable): handler(job) -> prediction string.
+        idle_exit (bool): Return when nothing is claimable; otherwise keep
+            polling every `poll_seconds` while other workers still hold
+            leases (which may expire and become claimable), and return once
+            every job is done or failed.
+
+    Returns:
+        int: The number of jobs this worker completed.
+    """
+    worker_id = worker_id or default_worker_id()
+    completed = 0
+    while True:
+        jobs = queue.claim(worker_id, batch_size, lease_seconds)
+        if not jobs:
+            if idle_exit:
+                return completed
+            stats = queue.stats()
+            if not stats.get(PENDING) and not stats.get(LEASED):
+                return completed
+            time.sleep(poll_seconds)
+            continue
+        for i, job in enumerate(jobs):
+            try:
+                result = handler(job)
+            except Exception as e:
+                print(f"[{worker_id}] job {job.id} failed: {e}")
+                queue.fail(worker_id, job.id, e)
+            else:
+                completed += queue.complete(worker_id, job.id, result)
+            # Keep the rest of the batch leased while we work through it.
+            queue.renew(worker_id, [j.id for j in jobs[i + 1:]], lease_seconds)
@@ -0,0 +1,118 @@
+import cv2
+import numpy as np
+
+from amazon_ml.geometry import AnalysisCache, analyze_dimensions, line_orientations
+from amazon_ml.lines import detect_lines
+from amazon_ml.ocr import get_reader
+from amazon_ml.profiles import get_profile
+from amazon_ml.tiling import dedupe_boxes, readtext_tiled
+
+# ----------------------------------------------------------
+# Line-first pipeline for dimensional entities.
+#
+# Dimension labels sit next to long horizontal or vertical lines, so the
+# lines are found first on a cheap downscaled copy. Text detection and
+# recognition then run only on bands around each line's endpoints and
+# midpoint, and the geometric analysis matches the labels to the lines.
+# When no long lines are found the whole image is OCR'd as before.
+# ----------------------------------------------------------
+
+# Longest side of the copy used for line detection.
+LINE_SEARCH_MAX_SIDE = 800
+
+# Lines shorter than this fraction of the shorter image side are ignored.
+MIN_LINE_FRACTION = 0.15
+
+# Band half-size across the line, as a fraction of the shorter image side (at least 32px).
+BAND_FRACTION = 0.08
+
+# Labels read horizontally, so bands across vertical lines are this much wider.
+VERTICAL_BAND_SCALE = 2.5
+
+
+def find_long_lines(image, engine='projection'):
+    # Long axis-aligned segments, detected on a downscaled copy and mapped back to full resolution.
+    height, width = image.shape[:2]
+    scale = min(1.0, LINE_SEARCH_MAX_SIDE / max(height, width))
+    small = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else image
+    min_line_length = max(20, int(MIN_LINE_FRACTION * min(small.shape[:2])))
+    segments = detect_lines(small, engine, min_line_length=min_line_length)
+    if not segments:
+        return []
+    lines = np.array(segments, dtype=np.float32)
+    keep = line_orientations(lines) != 'oblique'
+    return [tuple(int(round(v / scale)) for v in segment) for segment, k in zip(segments, keep) if k]
+
+
+def line_bands(segments, height, width):
+    """
+    Windows (x0, y0, x1, y1) around each segment's endpoints and midpoint.
+
+    Windows extend `band` across the line (VERTICAL_BAND_SCALE * `band` for
+    vertical lines, whose labels run sideways) and 1.5 * `band` along it.
+    Overlapping windows are merged so no pixel is OCR'd twice.
+    """
+    band = max(32, int(BAND_FRACTION * min(height, width)))
+    windows = []
+    for x1, y1, x2, y2 in segments:
+        horizontal = abs(x2 - x1) >= abs(y2 - y1)
+        half_x, half_y = (int(1.5 * band), band) if horizontal else (int(VERTICAL_BAND_SCALE * band), int(1.5 * band))
+        for cx, cy in ((x1, y1), (x2, y2), ((x1 + x2) // 2, (y1 + y2) // 2)):
+            windows.append([max(0, cx - half_x), max(0, cy - half_y),
+                            min(width, cx + half_x), min(height, cy + half_y)])
+
+    # Merge overlapping windows until none overlap.
+    merged = True
+    while merged:
+        merged = False
+        out = []
+        for window in windows:
+            for other in out:
+                if window[0] < other[2] and other[0] < window[2] and window[1] < other[3] and other[1] < window[3]:
+                    other[:] = [min(window[0], other[0]), min(window[1], other[1]),
+                                max(window[2], other[2]), max(window[3], other[3])]
+                    merged = True
+                    break
+            else:
+                out.append(window)
+        windows = out
+    return [tuple(window) for window in windows]
+
+
+def analyze_line_first(image, reader=None, engine='projection', entity='height', memory_budget_mb=None, **kwargs):
+    """
+    Geometric dimension analysis that only OCRs the bands around long lines.
+    With `memory_budget_mb`, bands (and the fallback) are OCR'd in tiles.
+
+    Returns:
+        tuple: (analysis dict as from `analyze_dimensions`, stats dict with
+        'ocr_pixel_fraction', 'windows' and 'fallback').
+    """
+    height, width = image.shape[:2]
+    segments = find_long_lines(image, engine)
+    if not segments:
+        # Nothing to anchor on: OCR the whole image.
+        analysis = analyze_dimensions(image, reader=reader, engine=engine, memory_budget_mb=memory_budget_mb,
+                                      **kwargs)
+        return analysis, {'ocr_pixel_fraction': 1.0, 'windows': 0, 'fallback': True}
+
+    reader = reader or get_reader()
+    profile = get_profile(entity)
+    results, pixels = [], 0
+    windows = line_bands(segments, height, width)
+    for x0, y0, x1, y1 in windows:
+        pixels += (x1 - x0) * (y1 - y0)
+        band = image[y0:y1, x0:x1]
+        if memory_budget_mb is not None:
+            band_results = readtext_tiled(band, reader, memory_budget_mb, **profile)
+        else:
+            band_results = reader.readtext(band, **profile)
+        for box, text, prob in band_results:
+            results.append(([[point[0] + x0, point[1] + y0] for point in box], text, prob))
+
+    analysis = analyze_dimensions(image, results=dedupe_boxes(results), segments=segments, **kwargs)
+    return analysis, {'ocr_pixel_fraction': pixels / (height * width), 'windows': len(windows), 'fallback': False}
+
+
+# Shared per-process cache so height, width and depth of one image reuse a single run.
+LINE_FIRST_CACHE = AnalysisCache(analyzer=lambda image, **kwargs: analyze_line_first(image, **kwargs)[0])
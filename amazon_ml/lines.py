@@ -0,0 +1,108 @@
+import cv2
+import numpy as np
+
+# ----------------------------------------------------------
+# Line-segment detection engines behind one interface.
+#
+# Every engine takes a grayscale image and returns a list of
+# (x1, y1, x2, y2) segments at least `min_line_length` long:
+#   hough       GaussianBlur + Canny + HoughLinesP (the original detector)
+#   lsd         OpenCV's Line Segment Detector, no thresholds to tune
+#   fld         FastLineDetector (needs opencv-contrib's ximgproc)
+#   projection  morphological opening with long horizontal/vertical
+#               kernels, which keeps only axis-aligned runs such as
+#               dimension lines and arrows
+# ----------------------------------------------------------
+
+DEFAULT_ENGINE = 'hough'
+
+
+def _hough_lines(gray, threshold=50, min_line_length=30, max_line_gap=5):
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+    edges = cv2.Canny(blurred, 50, 150)
+    lines = cv2.HoughLinesP(edges, 1, np.pi / 180, threshold=threshold,
+                            minLineLength=min_line_length, maxLineGap=max_line_gap)
+    # Depending on the OpenCV build, segments come as (N, 1, 4) or (N, 4).
+    return [] if lines is None else [tuple(int(v) for v in line) for line in lines.reshape(-1, 4)]
+
+
+def _long_enough(lines, min_line_length):
+    segments = []
+    for x1, y1, x2, y2 in lines.reshape(-1, 4):
+        if np.hypot(x2 - x1, y2 - y1) >= min_line_length:
+            segments.append((int(x1), int(y1), int(x2), int(y2)))
+    return segments
+
+
+def _lsd_lines(gray, min_line_length=30, **_):
+    lines = cv2.createLineSegmentDetector(cv2.LSD_REFINE_STD).detect(gray)[0]
+    return [] if lines is None else _long_enough(lines, min_line_length)
+
+
+def _fld_lines(gray, min_line_length=30, **_):
+    detector = cv2.ximgproc.createFastLineDetector(length_threshold=min_line_length)
+    lines = detector.detect(gray)
+    return [] if lines is None else _long_enough(lines, min_line_length)
+
+
+def _projection_lines(gray, min_line_length=30, **_):
+    # Dark strokes on a light background -> white foreground for morphology.
+    binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, 15, 10)
+    segments = []
+    for horizontal in (True, False):
+        # Opening with a 1px-thick kernel keeps only runs at least min_line_length long.
+        shape = (min_line_length, 1) if horizontal else (1, min_line_length)
+        opened = cv2.morphologyEx(binary, cv2.MORPH_OPEN, cv2.getStructuringElement(cv2.MORPH_RECT, shape))
+        contours, _ = cv2.findContours(opened, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        for contour in contours:
+            x, y, w, h = cv2.boundingRect(contour)
+            if horizontal:
+                segments.append((x, y + h // 2, x + w - 1, y + h // 2))
+            else:
+                segments.append((x + w // 2, y, x + w // 2, y + h - 1))
+    return segments
+
+
+ENGINES = {
+    'hough': _hough_lines,
+    'lsd': _lsd_lines,
+    'fld': _fld_lines,
+    'projection': _projection_lines,
+}
+
+
+def available_engines():
+    # Engines usable with the installed OpenCV build.
+    engines = ['hough', 'projection']
+    if hasattr(cv2, 'createLineSegmentDetector'):
+        engines.insert(1, 'lsd')
+    if hasattr(cv2, 'ximgproc'):
+        engines.insert(-1, 'fld')
+    return engines
+
+
+def require_engine(engine):
+    # Fail loudly rather than have every classification silently come back empty.
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown line engine '{engine}', expected one of {sorted(ENGINES)}")
+    if engine not in available_engines():
+        raise ValueError(f"Line engine '{engine}' is not available in this OpenCV build; "
+                         f"available: {available_engines()}")
+
+
+def detect_lines(image, engine=DEFAULT_ENGINE, **params):
+    """
+    Detect line segments with the chosen engine.
+
+    Args:
+        image (np.ndarray): BGR or grayscale image.
+        engine (str): One of `ENGINES`.
+        params: Engine parameters; all engines honour `min_line_length`,
+            Hough also takes `threshold` and `max_line_gap`.
+
+    Returns:
+        list: (x1, y1, x2, y2) tuples.
+    """
+    require_engine(engine)
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return ENGINES[engine](gray, **params)
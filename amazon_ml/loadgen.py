@@ -0,0 +1,221 @@
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from amazon_ml.stats import percentile
+
+# ----------------------------------------------------------
+# Request-log replay load generator.
+#
+# Replays a JSONL request log, one request per line:
+#   {"image": "<path or image_link>", "entity_name": "height", "group_id": "442321", "timestamp": 12.5}
+# against the pipeline, either in-process or through `python -m amazon_ml
+# serve`. Two modes are supported:
+#   open loop    arrivals at a fixed Poisson rate, or at the log's own
+#                timestamps; latency is measured from the scheduled arrival,
+#                so queueing under overload is counted (no coordinated omission)
+#   closed loop  N concurrent clients issuing back-to-back, swept over N
+# Nothing is downloaded. Images are resolved to local files by path or by
+# the basename of image_link in --image-dir, or else replaced by generated
+# synthetic images.
+# ----------------------------------------------------------
+
+
+def load_request_log(path, limit=None):
+    requests = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            request = json.loads(line)
+            request['image'] = request.get('image') or request.get('image_path') or request.get('image_link')
+            if not request.get('image') or not request.get('entity_name'):
+                continue
+            requests.append(request)
+            if limit is not None and len(requests) >= limit:
+                break
+    return requests
+
+
+def synthetic_image(path, entity_name, seed):
+    # A product-like test card: a dimension line with a numeric label next to it.
+    import cv2
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    height, width = int(rng.integers(400, 1600)), int(rng.integers(400, 1600))
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    value = f"{rng.integers(5, 200)}.{rng.integers(0, 10)} cm" if entity_name in ('height', 'width', 'depth') \
+        else f"{rng.integers(3, 250)} {'W' if entity_name == 'wattage' else 'V'}"
+    if entity_name == 'height':
+        cv2.line(image, (width // 5, height // 8), (width // 5, 7 * height // 8), (0, 0, 0), 2)
+        cv2.putText(image, value, (width // 5 + 10, height // 2), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+    else:
+        cv2.line(image, (width // 8, 4 * height // 5), (7 * width // 8, 4 * height // 5), (0, 0, 0), 2)
+        cv2.putText(image, value, (width // 2 - 60, 4 * height // 5 - 15), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 2)
+    cv2.imwrite(path, image)
+    return path
+
+
+def resolve_images(requests, image_dir=None, synthetic_dir=None):
+    """
+    Point every request at a local image file, without touching the network.
+
+    Returns:
+        int: how many requests were given synthetic images.
+    """
+    synthesized = 0
+    for i, request in enumerate(requests):
+        image = request['image']
+        if os.path.isfile(image):
+            continue
+        if image_dir and os.path.isfile(os.path.join(image_dir, os.path.basename(image))):
+            request['image'] = os.path.join(image_dir, os.path.basename(image))
+            continue
+        if synthetic_dir is None:
+            raise FileNotFoundError(f"No local image for {image}; pass --image-dir or --synthetic-dir")
+        os.makedirs(synthetic_dir, exist_ok=True)
+        path = os.path.join(synthetic_dir, f"synthetic_{i}_{request['entity_name']}.png")
+        request['image'] = path if os.path.isfile(path) else synthetic_image(path, request['entity_name'], i)
+        synthesized += 1
+    return synthesized
+
+
+# ----------------------------------------------------------
+# Targets: callables taking one request dict
+# ----------------------------------------------------------
+
+def inprocess_target(prior_index=None, reader=None):
+    import cv2
+    from amazon_ml.ocr import get_reader
+    from amazon_ml.predict import predict
+
+    get_reader()  # Build the reader up front so it does not count as request latency.
+
+    def call(request):
+        image = cv2.imread(request['image'])
+        if image is None:
+            raise ValueError(f"failed to load image from path: {request['image']}")
+        prior = None
+        if prior_index is not None and request.get('group_id'):
+            prior = prior_index.lookup(request['group_id'], request['entity_name'])
+        return predict(image, request['entity_name'], prior, reader=reader)
+    return call
+
+
+def http_target(url, timeout=60):
+    def call(request):
+        body = json.dumps({key: request.get(key) for key in ('image', 'entity_name', 'group_id')}).encode('utf-8')
+        http_request = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(http_request, timeout=timeout) as response:
+            return json.loads(response.read())['prediction']
+    return call
+
+
+def noop_target():
+    # Reads the image bytes only; measures the harness overhead itself.
+    def call(request):
+        with open(request['image'], 'rb') as f:
+            return len(f.read())
+    return call
+
+
+TARGETS = ('inprocess', 'http', 'noop')
+
+
+# ----------------------------------------------------------
+# Load modes
+# ----------------------------------------------------------
+
+def _timed(call, request, scheduled):
+    try:
+        call(request)
+        ok = True
+    except Exception:
+        ok = False
+    return time.perf_counter() - scheduled, ok
+
+
+def summarize(label, samples, wall_seconds):
+    latencies = [latency for latency, _ in samples]
+    errors = sum(1 for _, ok in samples if not ok)
+    return {
+        'run': label,
+        'requests': len(samples),
+        'errors': errors,
+        'throughput': len(samples) / wall_seconds if wall_seconds else 0.0,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p90_ms': percentile(latencies, 90) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'max_ms': max(latencies) * 1000 if latencies else float('nan'),
+    }
+
+
+def run_open_loop(requests, call, rate=None, max_in_flight=64, replay_timing=False, seed=0):
+    """
+    Issue requests on an arrival schedule that does not wait for responses.
+
+    Args:
+        rate (float): Mean arrivals per second (Poisson). Ignored with replay_timing.
+        replay_timing (bool): Use the log's `timestamp` offsets instead.
+        max_in_flight (int): Worker threads; requests beyond this queue up,
+            and the wait counts towards their latency.
+    """
+    rng = random.Random(seed)
+    first_timestamp = requests[0].get('timestamp', 0) if replay_timing else 0
+    offset = 0.0
+    futures = []
+    with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+        start = time.perf_counter()
+        for request in requests:
+            if replay_timing:
+                offset = request.get('timestamp', first_timestamp) - first_timestamp
+            else:
+                offset += rng.expovariate(rate)
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            futures.append(executor.submit(_timed, call, request, start + offset))
+        samples = [future.result() for future in futures]
+    label = 'replay timing' if replay_timing else f"open {rate:g}/s"
+    return summarize(label, samples, time.perf_counter() - start)
+
+
+def run_closed_loop(requests, call, concurrency, total=None):
+    # `concurrency` clients each send their next request as soon as the previous one returns.
+    total = total or len(requests)
+    pending = itertools.islice(itertools.cycle(requests), total)
+    lock = threading.Lock()
+    samples = []
+
+    def client():
+        while True:
+            with lock:
+                request = next(pending, None)
+            if request is None:
+                return
+            sample = _timed(call, request, time.perf_counter())
+            with lock:
+                samples.append(sample)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return summarize(f"closed c={concurrency}", samples, time.perf_counter() - start)
+
+
+def print_report(summaries, slo_p99_ms=None):
+    print(f"{'run':<16} {'n':>6} {'err':>5} {'req/s':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for s in summaries:
+        flag = '' if slo_p99_ms is None else ('  OK' if s['p99_ms'] <= slo_p99_ms else '  SLO MISS')
+        print(f"{s['run']:<16} {s['requests']:>6} {s['errors']:>5} {s['throughput']:>8.2f} {s['p50_ms']:>9.1f} "
+              f"{s['p90_ms']:>9.1f} {s['p99_ms']:>9.1f} {s['max_ms']:>9.1f}{flag}")
@@ -0,0 +1,160 @@
+from collections import namedtuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from amazon_ml.extract import extract_info
+from amazon_ml.profiles import get_profile
+from amazon_ml.tiling import readtext_tiled
+
+# EasyOCR (and torch underneath it) take seconds to import and the reader
+# loads model weights, so both are deferred until the first OCR call.
+_readers = {}
+
+
+def get_reader(languages=('en',), gpu=True):
+    # Return a cached EasyOCR reader, building it on first use.
+    key = (tuple(languages), gpu)
+    if key not in _readers:
+        import easyocr
+        _readers[key] = easyocr.Reader(list(languages), gpu=gpu)
+    return _readers[key]
+
+
+# Preprocess the image
+def preprocess_image(image):
+    # Convert the image to grayscale
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+    # Apply Gaussian blur to reduce noise
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+
+    # Apply adaptive thresholding to convert the image to binary
+    binary_image = cv2.adaptiveThreshold(blurred, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
+
+    # Resize image to make text clearer (if needed)
+    resized_image = cv2.resize(binary_image, None, fx=2, fy=2, interpolation=cv2.INTER_LINEAR)
+
+    return resized_image
+
+# Function to convert OpenCV image to PIL Image
+def convert_cv2_to_pil(cv2_img):
+    pil_img = Image.fromarray(cv2_img)
+    return pil_img
+
+# Function to convert PIL Image to OpenCV (BGR) image
+def convert_pil_to_cv2(pil_img):
+    return cv2.cvtColor(np.array(pil_img.convert('RGB')), cv2.COLOR_RGB2BGR)
+
+# ----------------------------------------------------------
+# Preprocessing cascade
+#
+# Instead of always binarizing and upscaling 2x, OCR the cheap colour image
+# first and only escalate to the heavier variants when no value for the
+# entity was found or the boxes it came from are low-confidence.
+# ----------------------------------------------------------
+
+# Longest side of the first, cheap colour pass.
+CHEAP_MAX_SIDE = 1280
+
+# Escalate when the best matching box is less confident than this.
+MIN_CONFIDENCE = 0.5
+
+# preprocess(image, scale) -> image; scale(image) -> resize factor it applies
+Tier = namedtuple('Tier', ['name', 'preprocess', 'scale'])
+
+
+def _resize(image, scale):
+    if scale == 1:
+        return image
+    interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+    return cv2.resize(image, None, fx=scale, fy=scale, interpolation=interpolation)
+
+
+def _cheap_scale(image):
+    return min(1.0, CHEAP_MAX_SIDE / max(image.shape[:2]))
+
+
+def _gray_clahe(image, scale):
+    # Contrast-equalized grayscale without thresholding, for thin or faded print.
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    equalized = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
+    return _resize(equalized, scale)
+
+
+def _inverted_binary(image, scale):
+    # Light text on a dark background (e.g. embossed spec plates).
+    return 255 - preprocess_image(image)
+
+
+TIERS = [
+    Tier('colour', _resize, _cheap_scale),
+    Tier('binary_2x', lambda image, scale: preprocess_image(image), lambda image: 2.0),
+    Tier('clahe_2x', _gray_clahe, lambda image: 2.0),
+    Tier('inverted_2x', _inverted_binary, lambda image: 2.0),
+]
+
+
+def entity_confidence(results, entity_name):
+    # Confidence of the best box holding a value for the entity, else of the weakest number box.
+    matched = [prob for (bbox, text, prob) in results if isinstance(extract_info(text, entity_name), list)]
+    if matched:
+        return max(matched)
+    numeric = [prob for (bbox, text, prob) in results if any(char.isdigit() for char in text)]
+    return min(numeric) if numeric else 0.0
+
+
+def run_cascade(image, entity_name, reader=None, tiers=None, min_confidence=MIN_CONFIDENCE,
+                memory_budget_mb=None, prior=None, **readtext_kwargs):
+    """
+    OCR an image tier by tier until a confident value for the entity is found.
+
+    Args:
+        image (np.ndarray): BGR image.
+        entity_name (str): CSV entity name, e.g. 'voltage'.
+        tiers (list of Tier, optional): Defaults to `TIERS`.
+        min_confidence (float): Confidence needed to stop escalating.
+        memory_budget_mb (float, optional): OCR each tier in tiles under this budget.
+        prior (priors.UnitPrior, optional): group_id unit prior for the entity.
+
+    Returns:
+        dict: 'value' (list of floats or 'Not found'), 'text' (the OCR text it
+        came from), 'tier' (name of the tier that resolved it, or None),
+        'confidence' and 'tiers_tried'.
+    """
+    reader = reader or get_reader()
+    best = {'value': 'Not found', 'text': '', 'tier': None, 'confidence': 0.0, 'tiers_tried': 0}
+    for tier in tiers or TIERS:
+        scale = tier.scale(image)
+        if memory_budget_mb is not None:
+            results = readtext_tiled(image, reader, memory_budget_mb,
+                                     preprocess=lambda tile: tier.preprocess(tile, scale), scale=scale,
+                                     **readtext_kwargs)
+        else:
+            results = reader.readtext(tier.preprocess(image, scale), **readtext_kwargs)
+        best['tiers_tried'] += 1
+
+        # Combine all extracted text into a single string
+        text_string = ' '.join([text for (bbox, text, prob) in results])
+        value = extract_info(text_string, entity_name, prior=prior)
+        if not isinstance(value, list):
+            continue
+        confidence = entity_confidence(results, entity_name)
+        if best['tier'] is None or confidence > best['confidence']:
+            best.update(value=value, text=text_string, tier=tier.name, confidence=confidence)
+        if confidence >= min_confidence:
+            break
+    return best
+
+
+# Function to extract text from an image and return the entity value
+def handle_voltage_wattage(image, entity_name, memory_budget_mb=None, use_profile=True, tiers=None, prior=None):
+    # Runs the preprocessing cascade; pass tiers=TIERS[1:2] for the old always-binarize behaviour.
+    # The entity's OCR profile restricts the recognizer to the characters it needs.
+    try:
+        profile = get_profile(entity_name) if use_profile else {}
+        return run_cascade(image, entity_name, tiers=tiers, memory_budget_mb=memory_budget_mb, prior=prior,
+                           **profile)['value']
+    except Exception as e:
+        return f"Error processing the image: {e}"
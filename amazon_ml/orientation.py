@@ -0,0 +1,108 @@
+import cv2
+import numpy as np
+
+# ----------------------------------------------------------
+# Cheap per-box text orientation.
+#
+# `readtext(..., rotation_info=[90, 180, 270])` re-recognizes every box
+# four times. Instead we detect once, estimate each box's orientation from
+# its aspect ratio and a two-bin gradient-orientation histogram, and only
+# pay for rotated recognition on boxes that look vertical. Boxes that look
+# upright but come back with low confidence are retried upside down.
+# ----------------------------------------------------------
+
+# Boxes at least this many times taller than wide are vertical text outright.
+ASPECT_THRESHOLD = 2.5
+
+# Below this ratio of horizontal- to vertical-gradient energy a box is vertical.
+# Upright Latin text and digits are dominated by vertical strokes (ratio > 1).
+GRADIENT_THRESHOLD = 0.8
+
+# Upright results below this confidence are retried rotated by 180 degrees.
+FLIP_CONFIDENCE = 0.3
+
+# readtext() keyword arguments that belong to the detection stage.
+DETECT_KWARGS = {
+    'min_size', 'text_threshold', 'low_text', 'link_threshold', 'canvas_size', 'mag_ratio',
+    'slope_ths', 'ycenter_ths', 'height_ths', 'width_ths', 'add_margin', 'optimal_num_chars',
+    'threshold', 'bbox_min_score', 'bbox_min_size', 'max_candidates',
+}
+
+
+def gradient_ratio(crop):
+    # Energy of horizontal gradients (vertical strokes) over vertical gradients.
+    gray = crop if crop.ndim == 2 else cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+    gx = cv2.Sobel(gray, cv2.CV_32F, 1, 0, ksize=3)
+    gy = cv2.Sobel(gray, cv2.CV_32F, 0, 1, ksize=3)
+    return float(np.abs(gx).sum() / (np.abs(gy).sum() + 1e-6))
+
+
+def estimate_orientation(crop, aspect_threshold=ASPECT_THRESHOLD, gradient_threshold=GRADIENT_THRESHOLD):
+    # Classify a text crop as 'horizontal' or 'vertical'.
+    h, w = crop.shape[:2]
+    if h == 0 or w == 0 or h < w:
+        return 'horizontal'
+    if h / w >= aspect_threshold:
+        return 'vertical'
+    return 'horizontal' if gradient_ratio(crop) >= gradient_threshold else 'vertical'
+
+
+def _box_key(box):
+    return tuple((int(round(x)), int(round(y))) for x, y in box)
+
+
+class OrientedReader:
+    """
+    Drop-in wrapper around an EasyOCR reader whose `readtext` only runs
+    rotated recognition on boxes judged vertical (90/270) or flipped (180).
+
+    `stats` counts boxes per orientation decision across calls.
+    """
+
+    def __init__(self, reader, flip_confidence=FLIP_CONFIDENCE,
+                 aspect_threshold=ASPECT_THRESHOLD, gradient_threshold=GRADIENT_THRESHOLD):
+        self.reader = reader
+        self.flip_confidence = flip_confidence
+        self.aspect_threshold = aspect_threshold
+        self.gradient_threshold = gradient_threshold
+        self.stats = {'horizontal': 0, 'vertical': 0, 'flipped': 0}
+
+    def readtext(self, image, **kwargs):
+        detect_kwargs = {k: v for k, v in kwargs.items() if k in DETECT_KWARGS}
+        recognize_kwargs = {k: v for k, v in kwargs.items() if k not in DETECT_KWARGS}
+        recognize_kwargs.pop('rotation_info', None)
+
+        horizontal_list, free_list = self.reader.detect(image, **detect_kwargs)
+        horizontal_list, free_list = horizontal_list[0], free_list[0]
+
+        upright, vertical = [], []
+        for box in horizontal_list:
+            x_min, x_max, y_min, y_max = [max(0, int(v)) for v in box]
+            crop = image[y_min:y_max, x_min:x_max]
+            if estimate_orientation(crop, self.aspect_threshold, self.gradient_threshold) == 'vertical':
+                vertical.append(box)
+            else:
+                upright.append(box)
+        self.stats['horizontal'] += len(upright) + len(free_list)
+        self.stats['vertical'] += len(vertical)
+
+        results = []
+        if upright or free_list:
+            results = list(self.reader.recognize(image, horizontal_list=upright, free_list=free_list,
+                                                 **recognize_kwargs))
+            # Possibly upside down: retry all low-confidence boxes in one 180 degree recognizer pass.
+            low = [i for i, result in enumerate(results) if result[2] < self.flip_confidence]
+            if low:
+                self.stats['flipped'] += len(low)
+                retries = self.reader.recognize(image, horizontal_list=[], free_list=[results[i][0] for i in low],
+                                                rotation_info=[180], **recognize_kwargs)
+                # EasyOCR returns boxes sorted by position, so match retries to results by box.
+                retried = {_box_key(retry[0]): retry for retry in retries}
+                for i in low:
+                    retry = retried.get(_box_key(results[i][0]))
+                    if retry is not None and retry[2] > results[i][2]:
+                        results[i] = retry
+        if vertical:
+            results.extend(self.reader.recognize(image, horizontal_list=vertical, free_list=[],
+                                                 rotation_info=[90, 270], **recognize_kwargs))
+        return results
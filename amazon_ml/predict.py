@@ -0,0 +1,71 @@
+from amazon_ml.budget import image_budget
+from amazon_ml.dimensions import detect_entity_in_image
+from amazon_ml.download import download_image
+from amazon_ml.extract import format_prediction
+from amazon_ml.geometry import detect_dimension, is_cached
+from amazon_ml.linefirst import LINE_FIRST_CACHE
+from amazon_ml.ocr import convert_pil_to_cv2, run_cascade
+from amazon_ml.profiles import get_profile
+
+# ----------------------------------------------------------
+# One prediction per (image, entity_name), in submission format.
+# ----------------------------------------------------------
+
+DIMENSION_ENTITIES = ('height', 'width', 'depth')
+
+
+def predict(image, entity_name, prior=None, memory_budget_mb=None, image_key=None, line_first=False, reader=None,
+            debug=None):
+    """
+    Predict the submission value for one image.
+
+    Args:
+        image (np.ndarray): Decoded BGR image.
+        entity_name (str): CSV entity name, e.g. 'height' or 'item_weight'.
+        prior (priors.UnitPrior, optional): group_id unit prior for the entity.
+        image_key (str, optional): Path or link identifying the image. When
+            given, dimensional entities come from one shared geometric
+            analysis per image instead of a separate run per entity.
+        line_first (bool): With `image_key`, find dimension lines first and
+            only OCR the bands around them.
+        reader (optional): OCR reader to use instead of the shared one, e.g.
+            a budget.BudgetedReader.
+        debug (visualize.DebugSink, optional): Receives detection records
+            for sampled and failed height/width/depth detections.
+
+    Returns:
+        str: e.g. '12.0 centimetre', or '' when nothing was found.
+    """
+    # With a BudgetedReader, every OCR call below shares one per-image latency budget.
+    with image_budget(reader, image):
+        return _predict(image, entity_name, prior, memory_budget_mb, image_key, line_first, reader, debug)
+
+
+def _predict(image, entity_name, prior, memory_budget_mb, image_key, line_first, reader, debug):
+    if entity_name in DIMENSION_ENTITIES:
+        if image_key is not None:
+            # The analysis is shared by all dimensions of the image, so it emits one debug record for them.
+            text = detect_dimension(image_key, entity_name, image, cache=LINE_FIRST_CACHE if line_first else None,
+                                    reader=reader, memory_budget_mb=memory_budget_mb, image_key=image_key,
+                                    debug=debug)
+        else:
+            text = detect_entity_in_image(image, entity_name, memory_budget_mb=memory_budget_mb, reader=reader,
+                                          debug=debug)
+        return format_prediction(text or '', entity_name, prior)
+    outcome = run_cascade(image, entity_name, reader=reader, memory_budget_mb=memory_budget_mb, prior=prior,
+                          **get_profile(entity_name))
+    return format_prediction(outcome['text'], entity_name, prior)
+
+
+def predict_job(job, prior_index=None, memory_budget_mb=None, geometric=False, line_first=False, reader=None,
+                debug=None):
+    # Work-queue handler: download the job's image and predict its entity.
+    prior = prior_index.lookup(job.group_id, job.entity_name) if prior_index is not None else None
+    image_key = job.image_link if geometric or line_first else None
+    cache = LINE_FIRST_CACHE if line_first else None
+    if image_key is not None and job.entity_name in DIMENSION_ENTITIES and is_cached(image_key, cache):
+        # Another dimension of this image was already analysed; no need to fetch it again.
+        image = None
+    else:
+        image = convert_pil_to_cv2(download_image(job.image_link))
+    return predict(image, job.entity_name, prior, memory_budget_mb, image_key, line_first, reader, debug)
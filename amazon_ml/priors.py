@@ -0,0 +1,199 @@
+import bisect
+import csv
+import math
+import mmap
+import struct
+from collections import Counter, defaultdict, namedtuple
+
+from amazon_ml.extract import parse_entity_value
+
+# ----------------------------------------------------------
+# group_id unit-prior index.
+#
+# Products in the same `group_id` strongly prefer the same units (mm vs
+# inch, cup vs ml) and similar magnitudes. `build_prior_index` turns the
+# labelled CSVs into a small, sorted, fixed-width binary table that
+# `PriorIndex` memory-maps and binary-searches, so each worker can load it
+# in well under a millisecond and share the pages with its siblings.
+#
+# File layout (little endian):
+#   header   MAGIC, version u16, unit count u16, entity count u16, record count u32
+#   strings  unit names then entity names, each u8 length + utf-8 bytes
+#   records  sorted by (group_id, entity index), RECORD_FORMAT each
+# ----------------------------------------------------------
+
+MAGIC = b'UPRI'
+VERSION = 1
+HEADER_FORMAT = '<4sHHHI'
+
+# group_id u32, entity u16, sample count u16, then TOP_UNITS x
+# (unit index u8, share u8 in 1/255ths, log10 p5 f16, log10 p95 f16)
+TOP_UNITS = 3
+RECORD_FORMAT = '<IHH' + 'BBee' * TOP_UNITS
+RECORD_SIZE = struct.calcsize(RECORD_FORMAT)
+
+# Pseudo group holding the entity-wide prior, used for unseen group_ids.
+ANY_GROUP = 0xFFFFFFFF
+NO_UNIT = 0xFF
+
+DEFAULT_CSVS = [
+    'filtered_data_height.csv',
+    'filtered_data_width.csv',
+    'filtered_data_depth.csv',
+    'filtered_1000_rows.csv',
+    'Dataset_100_Images/max_wieight_only_100.csv',
+    'Dataset_100_Images/volume_only_100.csv',
+    'Dataset_100_Images/weight_only_100.csv',
+]
+
+# units: list of (unit, share, log10_low, log10_high), most likely first
+UnitPrior = namedtuple('UnitPrior', ['units', 'count'])
+
+
+def _quantile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _summarize(units, magnitudes):
+    # Top units with their share of samples and a robust (p5..p95) log10 value range.
+    total = sum(units.values())
+    summary = []
+    for unit, count in units.most_common(TOP_UNITS):
+        ordered = sorted(magnitudes[unit]) or [0.0]
+        summary.append((unit, count / total, _quantile(ordered, 0.05), _quantile(ordered, 0.95)))
+    return UnitPrior(summary, total)
+
+
+def build_prior_index(csv_paths, out_path):
+    """
+    Build the unit-prior table from labelled CSVs.
+
+    Args:
+        csv_paths (list): CSVs with group_id, entity_name and entity_value columns.
+        out_path (str): Where to write the binary table.
+
+    Returns:
+        int: The number of records written.
+    """
+    units = defaultdict(Counter)
+    magnitudes = defaultdict(lambda: defaultdict(list))
+    for csv_path in csv_paths:
+        with open(csv_path, newline='') as f:
+            for row in csv.DictReader(f):
+                values, unit = parse_entity_value(row.get('entity_value'))
+                if not values or not unit or ' to ' in unit or not row.get('group_id'):
+                    continue
+                for group in (int(row['group_id']), ANY_GROUP):
+                    key = (group, row['entity_name'])
+                    units[key][unit] += 1
+                    magnitudes[key][unit].extend(math.log10(v) for v in values if v > 0)
+
+    unit_names = sorted({unit for counter in units.values() for unit in counter})
+    entity_names = sorted({entity for _, entity in units})
+    unit_ids = {unit: i for i, unit in enumerate(unit_names)}
+    entity_ids = {entity: i for i, entity in enumerate(entity_names)}
+
+    records = []
+    for (group, entity), counter in units.items():
+        prior = _summarize(counter, magnitudes[group, entity])
+        fields = [group, entity_ids[entity], min(prior.count, 0xFFFF)]
+        for i in range(TOP_UNITS):
+            if i < len(prior.units):
+                unit, share, low, high = prior.units[i]
+                fields += [unit_ids[unit], max(1, round(share * 255)), low, high]
+            else:
+                fields += [NO_UNIT, 0, 0.0, 0.0]
+        records.append(fields)
+    records.sort(key=lambda fields: (fields[0], fields[1]))
+
+    with open(out_path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, len(unit_names), len(entity_names), len(records)))
+        for name in unit_names + entity_names:
+            encoded = name.encode('utf-8')
+            f.write(struct.pack('<B', len(encoded)) + encoded)
+        for fields in records:
+            f.write(struct.pack(RECORD_FORMAT, *fields))
+    return len(records)
+
+
+class PriorIndex:
+    """
+    Read-only, memory-mapped view of a table written by `build_prior_index`.
+
+    Only the header and string tables are parsed on load; records are
+    unpacked on demand during the binary search.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_units, n_entities, self._count = struct.unpack_from(HEADER_FORMAT, self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} unit-prior index")
+
+        offset = struct.calcsize(HEADER_FORMAT)
+        names = []
+        for _ in range(n_units + n_entities):
+            length = self._map[offset]
+            names.append(self._map[offset + 1:offset + 1 + length].decode('utf-8'))
+            offset += 1 + length
+        self.units = names[:n_units]
+        self.entity_ids = {name: i for i, name in enumerate(names[n_units:])}
+        self._records = offset
+
+    def __len__(self):
+        return self._count
+
+    def _key(self, i):
+        return struct.unpack_from('<IH', self._map, self._records + i * RECORD_SIZE)
+
+    def _find(self, group, entity_id):
+        # Binary search over the sorted fixed-width records.
+        keys = _RecordKeys(self)
+        i = bisect.bisect_left(keys, (group, entity_id))
+        if i < self._count and keys[i] == (group, entity_id):
+            fields = struct.unpack_from(RECORD_FORMAT, self._map, self._records + i * RECORD_SIZE)
+            units = []
+            for j in range(TOP_UNITS):
+                unit, share, low, high = fields[3 + 4 * j:7 + 4 * j]
+                if unit != NO_UNIT:
+                    units.append((self.units[unit], share / 255, low, high))
+            return UnitPrior(units, fields[2])
+        return None
+
+    def lookup(self, group_id, entity_name):
+        # Prior for a (group_id, entity_name) pair, falling back to the entity-wide prior.
+        entity_id = self.entity_ids.get(entity_name)
+        if entity_id is None:
+            return None
+        try:
+            group = int(group_id)
+        except (TypeError, ValueError):
+            group = ANY_GROUP
+        return self._find(group, entity_id) or self._find(ANY_GROUP, entity_id)
+
+    def close(self):
+        self._map.close()
+
+
+class _RecordKeys:
+    # Sequence view of record keys so `bisect` can search the mapped file directly.
+
+    def __init__(self, index):
+        self._index = index
+
+    def __len__(self):
+        return len(self._index)
+
+    def __getitem__(self, i):
+        return self._index._key(i)
+
+
+_loaded = {}
+
+
+def load_prior_index(path):
+    # One mapped index per path per process.
+    if path not in _loaded:
+        _loaded[path] = PriorIndex(path)
+    return _loaded[path]
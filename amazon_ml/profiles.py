@@ -0,0 +1,58 @@
+import re
+
+from amazon_ml.extract import PATTERNS, normalize_entity_name
+
+# ----------------------------------------------------------
+# Per-entity OCR profiles.
+#
+# The regex layer only ever looks at digits, a few separators and the unit
+# words of one entity, so the recognizer does not need the full character
+# set. Each profile is a dict of `readtext` keyword arguments: an allowlist
+# built from that entity's unit words, the decoder, contrast handling and
+# the detector canvas size. Use `python -m amazon_ml.bench.profiles` to
+# re-tune them against the labelled CSVs.
+# ----------------------------------------------------------
+
+# Digits, the separators seen in values and ranges ("100-240V", "4,5 cm", "12/18 W"),
+# dimension separators ("12 x 18 cm") and the space. EasyOCR drops anything outside
+# the allowlist, spaces included, so without ' ' words are glued together.
+BASE_CHARACTERS = '0123456789.,-/xX '
+
+PROFILE_SETTINGS = {
+    # Short numeric labels on spec plates: greedy is enough, boost low contrast.
+    # The full canvas leaves room for the 2x upscale in `preprocess_image`.
+    'voltage': {'decoder': 'greedy', 'contrast_ths': 0.3, 'adjust_contrast': 0.7, 'canvas_size': 2560},
+    'wattage': {'decoder': 'greedy', 'contrast_ths': 0.3, 'adjust_contrast': 0.7, 'canvas_size': 2560},
+    # Dimension callouts are usually clean printed digits next to a line.
+    'height': {'decoder': 'greedy', 'canvas_size': 1600},
+    'width': {'decoder': 'greedy', 'canvas_size': 1600},
+    'depth': {'decoder': 'greedy', 'canvas_size': 1600},
+    # Packaging text: beam search separates 'oz'/'02', 'l'/'1', 'g'/'9'.
+    'weight': {'decoder': 'beamsearch', 'beamWidth': 5, 'canvas_size': 1600},
+    'volume': {'decoder': 'beamsearch', 'beamWidth': 5, 'canvas_size': 1600},
+}
+
+_UNIT_GROUP = re.compile(r'\\s\?\((.*)\)$')
+
+
+def entity_allowlist(entity_name):
+    # Characters the recognizer may emit for an entity: digits, separators and unit letters.
+    key = normalize_entity_name(entity_name)
+    match = _UNIT_GROUP.search(PATTERNS[key])
+    letters = set(c for c in match.group(1) if c.isalpha()) if match else set()
+    letters |= set(c.upper() for c in letters)
+    return BASE_CHARACTERS + ''.join(sorted(letters - set(BASE_CHARACTERS)))
+
+
+def get_profile(entity_name):
+    """
+    Return the `readtext` keyword arguments for a CSV `entity_name`.
+
+    Unknown or missing entity names get an empty profile (EasyOCR defaults).
+    """
+    key = normalize_entity_name(entity_name) if entity_name else None
+    if key not in PROFILE_SETTINGS:
+        return {}
+    profile = dict(PROFILE_SETTINGS[key])
+    profile['allowlist'] = entity_allowlist(key)
+    return profile
@@ -0,0 +1,66 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import cv2
+
+from amazon_ml.ocr import get_reader
+from amazon_ml.predict import predict
+
+# ----------------------------------------------------------
+# Minimal local HTTP endpoint for the prediction pipeline.
+#
+#   POST /predict  {"image": "<local path>", "entity_name": "height", "group_id": "442321"}
+#   -> {"prediction": "12.0 centimetre"}
+#
+# Images are read from the local filesystem only; this is a test harness
+# for latency measurements, not a public service.
+# ----------------------------------------------------------
+
+
+class PredictHandler(BaseHTTPRequestHandler):
+    prior_index = None
+    reader = None
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path != '/predict':
+            self._reply(404, {'error': f"unknown path {self.path}"})
+            return
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            image = cv2.imread(request['image'])
+            if image is None:
+                self._reply(400, {'error': f"failed to load image from path: {request['image']}"})
+                return
+            prior = None
+            if self.prior_index is not None and request.get('group_id'):
+                prior = self.prior_index.lookup(request['group_id'], request['entity_name'])
+            self._reply(200, {'prediction': predict(image, request['entity_name'], prior, reader=self.reader)})
+        except Exception as e:
+            self._reply(500, {'error': str(e)})
+
+    def log_message(self, format, *args):
+        # Per-request access logs would dominate the latency being measured.
+        pass
+
+
+def serve(host='127.0.0.1', port=8000, prior_index=None, reader=None):
+    # Build the OCR reader before accepting requests so the first one is not an outlier.
+    get_reader()
+    PredictHandler.prior_index = prior_index
+    PredictHandler.reader = reader
+    server = ThreadingHTTPServer((host, port), PredictHandler)
+    print(f"Serving predictions on http://{host}:{port}/predict")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,14 @@
+import math
+
+# ----------------------------------------------------------
+# Small statistics helpers shared by runtime reporting and the benchmarks.
+# ----------------------------------------------------------
+
+
+def percentile(samples, p):
+    # Nearest-rank percentile of a list of numbers (p in 0..100).
+    if not samples:
+        return float('nan')
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
@@ -0,0 +1,178 @@
+import resource
+import sys
+
+import numpy as np
+
+# ----------------------------------------------------------
+# Tiled OCR for very large images.
+#
+# CRAFT's activations scale with the area of the detector canvas, so a
+# multi-megapixel photo (or one upscaled 2x by preprocessing) can OOM a
+# worker. Here the image is cut into overlapping tiles small enough for a
+# memory budget, each tile is OCR'd on its own and boxes are shifted back
+# into image coordinates, with duplicates along the seams removed.
+# ----------------------------------------------------------
+
+# Rough peak bytes per detector-canvas pixel for EasyOCR's CRAFT on CPU
+# (activations + intermediate copies); tune per machine.
+DEFAULT_BYTES_PER_PIXEL = 1200
+
+# Overlap between neighbouring tiles; must exceed the tallest text line so
+# every word appears whole in at least one tile.
+DEFAULT_OVERLAP = 64
+
+MIN_TILE_SIZE = 320
+
+
+def tile_size_for_budget(memory_budget_mb, scale=1.0, bytes_per_pixel=DEFAULT_BYTES_PER_PIXEL):
+    # Largest square tile (in source pixels) whose detector canvas fits in the budget.
+    budget_pixels = memory_budget_mb * 1024 * 1024 / bytes_per_pixel
+    side = int(np.sqrt(budget_pixels) / scale)
+    return max(MIN_TILE_SIZE, side)
+
+
+def iter_tiles(height, width, tile_size, overlap=DEFAULT_OVERLAP):
+    """
+    Yield (x0, y0, x1, y1) windows covering an image with overlapping tiles.
+
+    Tiles are spread evenly so the last row/column is not a thin sliver.
+    """
+    overlap = min(overlap, tile_size // 2)
+
+    def starts(length):
+        if length <= tile_size:
+            return [0]
+        step = tile_size - overlap
+        count = int(np.ceil((length - overlap) / step))
+        # Spread the tiles evenly over the full length.
+        return [int(round(i * (length - tile_size) / (count - 1))) for i in range(count)]
+
+    for y0 in starts(height):
+        for x0 in starts(width):
+            yield x0, y0, min(width, x0 + tile_size), min(height, y0 + tile_size)
+
+
+def _box_rect(box):
+    xs = [point[0] for point in box]
+    ys = [point[1] for point in box]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def dedupe_boxes(results, containment=0.5):
+    """
+    Remove duplicate detections produced by overlapping tiles.
+
+    A box is dropped when at least `containment` of its area lies inside a
+    larger (or equally large but more confident) box that was already kept.
+    Words cut by a seam in one tile appear whole in the neighbouring tile,
+    so the truncated copy is the one that goes.
+    """
+    def area(rect):
+        return max(0, rect[2] - rect[0]) * max(0, rect[3] - rect[1])
+
+    ranked = sorted(results, key=lambda r: (area(_box_rect(r[0])), r[2]), reverse=True)
+    kept, kept_rects = [], []
+    for result in ranked:
+        rect = _box_rect(result[0])
+        own_area = area(rect) or 1
+        duplicate = False
+        for other in kept_rects:
+            ix = min(rect[2], other[2]) - max(rect[0], other[0])
+            iy = min(rect[3], other[3]) - max(rect[1], other[1])
+            if ix > 0 and iy > 0 and ix * iy / own_area >= containment:
+                duplicate = True
+                break
+        if not duplicate:
+            kept.append(result)
+            kept_rects.append(rect)
+
+    # Restore reading order (top-to-bottom, left-to-right).
+    kept.sort(key=lambda r: (_box_rect(r[0])[1], _box_rect(r[0])[0]))
+    return kept
+
+
+def readtext_tiled(image, reader, memory_budget_mb=1024, tile_size=None, overlap=DEFAULT_OVERLAP,
+                   preprocess=None, scale=1.0, bytes_per_pixel=DEFAULT_BYTES_PER_PIXEL, **readtext_kwargs):
+    """
+    Run `reader.readtext` tile by tile under a peak-memory budget.
+
+    Args:
+        image (np.ndarray): The full decoded image.
+        reader: An EasyOCR reader.
+        memory_budget_mb (float): Detector memory budget used to size tiles.
+        tile_size (int, optional): Force a tile size instead of deriving it.
+        overlap (int): Overlap between neighbouring tiles in source pixels.
+        preprocess (callable, optional): Applied to each tile before OCR
+            (e.g. `preprocess_image`), so no full-size preprocessed copy exists.
+        scale (float): Resize factor applied by `preprocess`; boxes are mapped back.
+
+    Returns:
+        list: EasyOCR-style (bbox, text, prob) tuples in image coordinates.
+    """
+    height, width = image.shape[:2]
+    if tile_size is None:
+        tile_size = tile_size_for_budget(memory_budget_mb, scale, bytes_per_pixel)
+
+    # Keep the detector from upscaling a tile beyond what the budget allows.
+    canvas_cap = int(tile_size * scale)
+    readtext_kwargs['canvas_size'] = min(readtext_kwargs.get('canvas_size', canvas_cap), canvas_cap)
+
+    results = []
+    for x0, y0, x1, y1 in iter_tiles(height, width, tile_size, overlap):
+        tile = image[y0:y1, x0:x1]  # A view, not a copy.
+        if preprocess is not None:
+            tile = preprocess(tile)
+        for box, text, prob in reader.readtext(tile, **readtext_kwargs):
+            box = [[point[0] / scale + x0, point[1] / scale + y0] for point in box]
+            results.append((box, text, prob))
+
+    if height <= tile_size and width <= tile_size:
+        return results
+    return dedupe_boxes(results)
+
+
+# ----------------------------------------------------------
+# Peak RSS reporting
+# ----------------------------------------------------------
+
+def reset_peak_rss():
+    # Reset the kernel's high-water mark so the next reading is per image (Linux only).
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    # Peak resident set size of this process in MB.
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class PeakRSS:
+    """
+    Context manager measuring the peak RSS of the enclosed block.
+
+    Where the high-water mark cannot be reset (non-Linux), `mb` is the
+    process-wide peak so far and `exact` is False. GPU memory is not included.
+    """
+
+    def __enter__(self):
+        self.exact = reset_peak_rss()
+        self.mb = None
+        return self
+
+    def __exit__(self, *exc_info):
+        self.mb = peak_rss_mb()
+        return False
+
@@ -0,0 +1,170 @@
+import os
+import struct
+import time
+from collections import namedtuple
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# ----------------------------------------------------------
+# Shared-memory transport for decoded images between pipeline processes.
+#
+# A SharedRing is one `multiprocessing.shared_memory` block used as a ring
+# buffer by one producer stage and one consumer stage. The producer copies
+# each decoded frame into the ring once and passes the consumer a small
+# FrameHandle (offset, shape, dtype, strides) over an ordinary queue. The
+# consumer maps the frame in place without unpickling pixels. ROI crops
+# are handles into the same frame, so they are not copied either.
+#
+# Space is reclaimed explicitly. The consumer calls `release(handle)` when
+# it is done with a frame. Releases are cumulative: releasing a frame also
+# frees every frame that was put before it, so consumers release in
+# arrival order.
+#
+#   ring = SharedRing(size_mb=256)              # producer; pass `ring` to the child process
+#   queue.put(ring.put(image))
+#   ...
+#   handle = queue.get()                         # consumer
+#   label = ring.view(ring.crop(handle, x0, y0, x1, y1))
+#   ring.release(handle)
+# ----------------------------------------------------------
+
+# head (bytes ever reserved), tail (bytes ever released); positions in the ring's byte stream
+_HEADER = struct.Struct('<qq')
+HEADER_SIZE = 64
+
+# Frames start on cache-line boundaries.
+ALIGNMENT = 64
+
+DEFAULT_RING_MB = 256
+
+# How often a producer re-checks a full ring.
+POLL_SECONDS = 0.001
+
+# ring: shared memory name, offset: byte offset in the block,
+# end: stream position freed by releasing this frame
+FrameHandle = namedtuple('FrameHandle', ['ring', 'offset', 'shape', 'dtype', 'strides', 'end'])
+
+
+def _attach(name):
+    try:
+        # Python 3.13+: only the creating process should unlink the block.
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Older versions register the block again. Child processes share the
+        # creator's resource tracker, so it is still unlinked only once.
+        return shared_memory.SharedMemory(name=name)
+
+
+def attach_ring(name):
+    # Open a ring created by another process (also used when a ring is pickled to a child).
+    return SharedRing(name=name, create=False)
+
+
+class SharedRing:
+    """
+    Single-producer, single-consumer ring of numpy frames in shared memory.
+
+    Args:
+        name (str, optional): Shared memory name; generated when creating.
+        size_mb (float): Ring capacity when creating.
+        create (bool): Create the block (and own it) rather than attach to `name`.
+    """
+
+    def __init__(self, name=None, size_mb=DEFAULT_RING_MB, create=True):
+        if create:
+            capacity = int(size_mb * 1024 * 1024) // ALIGNMENT * ALIGNMENT
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity)
+            _HEADER.pack_into(self._shm.buf, 0, 0, 0)
+        else:
+            self._shm = _attach(name)
+        # Only the creating process unlinks, even if a forked child inherits this object.
+        self._owner_pid = os.getpid() if create else None
+        self.name = self._shm.name
+        self.capacity = (self._shm.size - HEADER_SIZE) // ALIGNMENT * ALIGNMENT
+
+    def __reduce__(self):
+        # Sending a ring to another process attaches to the same block there.
+        return attach_ring, (self.name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def in_use(self):
+        head, tail = _HEADER.unpack_from(self._shm.buf, 0)
+        return head - tail
+
+    def _reserve(self, nbytes, timeout):
+        # Offset of `nbytes` contiguous free bytes, waiting for the consumer to release space if needed.
+        size = -(-nbytes // ALIGNMENT) * ALIGNMENT
+        if size > self.capacity:
+            raise ValueError(f"{nbytes} byte frame does not fit in a {self.capacity} byte ring")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            head, tail = _HEADER.unpack_from(self._shm.buf, 0)
+            start, offset = head, head % self.capacity
+            if offset + size > self.capacity:
+                # Not enough room before the end of the block: skip to its start.
+                start, offset = head + self.capacity - offset, 0
+            if start + size - tail <= self.capacity:
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"ring {self.name} is full; is the consumer releasing frames?")
+            time.sleep(POLL_SECONDS)
+        struct.pack_into('<q', self._shm.buf, 0, start + size)
+        return HEADER_SIZE + offset, start + size
+
+    def allocate(self, shape, dtype=np.uint8, timeout=None):
+        """
+        Reserve a C-contiguous frame in the ring, for writing into directly
+        (e.g. as the `dst` of cv2.resize or cv2.cvtColor).
+
+        Returns:
+            tuple: (FrameHandle, writable np.ndarray view of the frame).
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(int(v) for v in shape)
+        strides, step = [], dtype.itemsize
+        for size in reversed(shape):
+            strides.insert(0, step)
+            step *= size
+        strides = tuple(strides)
+        offset, end = self._reserve(int(np.prod(shape)) * dtype.itemsize, timeout)
+        handle = FrameHandle(self.name, offset, shape, dtype.str, strides, end)
+        return handle, self.view(handle)
+
+    def put(self, array, timeout=None):
+        # Copy `array` into the ring (the only copy made) and return its handle.
+        handle, view = self.allocate(array.shape, array.dtype, timeout)
+        view[...] = array
+        return handle
+
+    def view(self, handle):
+        # The frame (or crop) in place. Drop the array before the frame is released.
+        return np.ndarray(handle.shape, np.dtype(handle.dtype), buffer=self._shm.buf,
+                          offset=handle.offset, strides=handle.strides)
+
+    def crop(self, handle, x0, y0, x1, y1):
+        # Handle of a region of interest within `handle`; shares the frame's memory and lifetime.
+        height, width = handle.shape[:2]
+        x0, x1 = max(0, min(x0, width)), max(0, min(x1, width))
+        y0, y1 = max(0, min(y0, height)), max(0, min(y1, height))
+        offset = handle.offset + y0 * handle.strides[0] + x0 * handle.strides[1]
+        return handle._replace(offset=offset, shape=(max(y0, y1) - y0, max(x0, x1) - x0) + handle.shape[2:])
+
+    def release(self, handle):
+        # Free `handle`'s frame and every frame put before it.
+        if handle.ring != self.name:
+            raise ValueError(f"handle belongs to ring {handle.ring}, not {self.name}")
+        _, tail = _HEADER.unpack_from(self._shm.buf, 0)
+        if handle.end > tail:
+            struct.pack_into('<q', self._shm.buf, 8, handle.end)
+
+    def close(self):
+        # Views returned by `view`/`allocate` must be gone before closing.
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
@@ -0,0 +1,169 @@
+import os
+import queue
+import random
+import threading
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+from amazon_ml.dimensions import classify_line, contains_numbers, extend_bounding_box
+from amazon_ml.ocr import get_reader
+
+# ----------------------------------------------------------
+# Debug visualization, kept out of the detection hot path.
+#
+# Detection code only builds a DetectionRecord (boxes, texts, labels and a
+# reference to the image, never a copy) and hands it to an optional
+# DebugSink. The sink renders annotated PNGs in a background thread, only
+# for a random sample of images and for images where nothing was found.
+# ----------------------------------------------------------
+
+# key: image path (or None), image: the decoded image if already loaded (not copied),
+# boxes / number_boxes / extended_boxes: OCR boxes at each step,
+# labels: (extended box, text, classification) per number box, result: detected text or None
+DetectionRecord = namedtuple('DetectionRecord', ['key', 'entity', 'image', 'boxes', 'number_boxes',
+                                                 'extended_boxes', 'labels', 'result', 'error'])
+
+# --- Function Definitions ---
+
+# Function to draw bounding boxes on the image.
+def draw_bounding_boxes(image, boxes, color=(0, 255, 0)):
+    for box in boxes:
+        box = np.array(box, dtype=np.int32)
+        cv2.polylines(image, [box], isClosed=True, color=color, thickness=2)
+    return image
+
+# All steps of one detection on a single annotated copy of the image.
+def render_record(image, record):
+    annotated = image.copy()
+    draw_bounding_boxes(annotated, record.boxes)
+    draw_bounding_boxes(annotated, record.number_boxes, color=(255, 0, 0))
+    draw_bounding_boxes(annotated, record.extended_boxes, color=(0, 0, 255))
+    for extended_box, text, classification in record.labels:
+        x_min = int(min(point[0] for point in extended_box))
+        y_min = int(min(point[1] for point in extended_box))
+        cv2.putText(annotated, f"{text}: {classification}", (x_min, max(20, y_min - 10)),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0) if classification else (0, 0, 255), 2)
+    title = f"{record.entity}: {record.result if record.result is not None else 'not found'}"
+    if record.error:
+        title += f" ({record.error})"
+    cv2.putText(annotated, title, (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 0, 255), 2)
+    return annotated
+
+
+class DebugSink:
+    """
+    Renders DetectionRecords to `out_dir` in a background thread.
+
+    Args:
+        out_dir (str): Where annotated PNGs are written.
+        sample_rate (float): Fraction of successful detections to render.
+        failures (bool): Always render detections that found nothing.
+        max_pending (int): Records waiting to be rendered; further records
+            are dropped rather than slowing detection down.
+    """
+
+    def __init__(self, out_dir, sample_rate=0.01, failures=True, max_pending=32, seed=None):
+        self.out_dir = out_dir
+        self.sample_rate = sample_rate
+        self.failures = failures
+        self.stats = {'emitted': 0, 'rendered': 0, 'dropped': 0}
+        self._random = random.Random(seed)
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._count = 0
+        os.makedirs(out_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name='debug-sink', daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def emit(self, record):
+        # Called from the detection path: a sampling decision and a queue put, nothing else.
+        failed = record.result is None
+        if not ((failed and self.failures) or self._random.random() < self.sample_rate):
+            return
+        self.stats['emitted'] += 1
+        try:
+            self._pending.put_nowait(record)
+        except queue.Full:
+            self.stats['dropped'] += 1
+
+    def _run(self):
+        while True:
+            record = self._pending.get()
+            if record is None:
+                return
+            try:
+                self._render(record)
+            except Exception as e:
+                print(f"Error rendering debug image for {record.key}: {e}")
+
+    def _render(self, record):
+        image = record.image if record.image is not None else cv2.imread(record.key)
+        if image is None:
+            return
+        self._count += 1
+        stem = os.path.splitext(os.path.basename(record.key))[0] if record.key else 'image'
+        path = os.path.join(self.out_dir, f"{self._count:06d}_{stem}_{record.entity}.png")
+        cv2.imwrite(path, render_record(image, record))
+        self.stats['rendered'] += 1
+
+    def close(self):
+        # Render whatever is still queued, then stop the thread.
+        self._pending.put(None)
+        self._thread.join()
+
+
+# Step-by-step walk-through of OCR, filtering, extension and classification, rendered to `out_dir`.
+def process_image(image_path, gpu=True, out_dir='debug'):
+    # Shared EasyOCR reader.
+    reader = get_reader(gpu=gpu)
+
+    # Load the image in OpenCV.
+    image = cv2.imread(image_path)
+    if image is None:
+        print(f"Failed to load image: {image_path}")
+        return None
+
+    image_height, image_width = image.shape[:2]
+
+    # Step 1: Detect all texts.
+    results = reader.readtext(image)
+    all_bboxes = [r[0] for r in results]  # Extract bounding boxes.
+
+    # Step 2: Filter bounding boxes that contain numbers.
+    number_bboxes_text = [(r[0], r[1]) for r in results if contains_numbers(r[1])]
+    number_bboxes = [bbox for bbox, text in number_bboxes_text]
+
+    # Step 3: Apply extension of 50px to the bounding boxes.
+    extended_bboxes = [extend_bounding_box(bbox, image_width, image_height, extend_px=50) for bbox in number_bboxes]
+
+    # Step 4: Classify which bounding boxes contain horizontal or vertical lines.
+    labels = []
+    for extended_bbox, text in zip(extended_bboxes, [t[1] for t in number_bboxes_text]):
+        # Convert extended_bbox into integer format for OpenCV cropping.
+        x_min = int(min([point[0] for point in extended_bbox]))
+        y_min = int(min([point[1] for point in extended_bbox]))
+        x_max = int(max([point[0] for point in extended_bbox]))
+        y_max = int(max([point[1] for point in extended_bbox]))
+
+        # Send the ROI to the classifier (stricter Hough settings than the deploy path).
+        classification_result = classify_line(image[y_min:y_max, x_min:x_max],
+                                              threshold=100, min_line_length=100, max_line_gap=10)
+        if classification_result:
+            print(f"Classification result for text '{text}': {classification_result}")
+        labels.append((extended_bbox, text, classification_result))
+
+    # Step 5: Render every step onto one annotated image.
+    found = [text for _, text, classification in labels if classification]
+    record = DetectionRecord(image_path, 'width/height', image, all_bboxes, number_bboxes, extended_bboxes,
+                             labels, found[0] if found else None, None)
+    with DebugSink(out_dir, sample_rate=1.0) as sink:
+        sink.emit(record)
+    print(f"Annotated image written to {out_dir}")
+    return record
@@ -0,0 +1,82 @@
+from collections import namedtuple
+
+from amazon_ml.budget import (CANVAS_LEVELS, BudgetedReader, CanvasController, bucket_for, image_budget,
+                              resolution_options)
+
+# Only `.shape` is read from images here, so no numpy is needed.
+Image = namedtuple('Image', ['shape'])
+
+
+class FakeReader:
+    def __init__(self):
+        self.calls = []
+
+    def readtext(self, image, **kwargs):
+        self.calls.append(kwargs)
+        return []
+
+
+def test_cap_below_smallest_level_still_gives_an_option():
+    # A 320px tile canvas (tiling under a small memory budget).
+    options = resolution_options(1000, 1000, max_canvas=320)
+    assert options and {canvas for canvas, _, _ in options} == {320}
+    settings, _ = CanvasController(500).choose(1000, 1000, max_canvas=320)
+    assert settings['canvas_size'] == 320
+
+
+def test_profile_cap_between_levels_can_be_chosen():
+    canvases = {canvas for canvas, _, _ in resolution_options(3000, 2000, max_canvas=1600)}
+    assert max(canvases) == 1600
+    assert canvases <= {1600} | set(CANVAS_LEVELS)
+    # With plenty of budget the profile's own canvas is used, not the level below it.
+    settings, _ = CanvasController(1e9).choose(3000, 2000, max_canvas=1600)
+    assert settings['canvas_size'] == 1600
+
+
+def test_choose_fits_the_budget_and_falls_back_to_the_cheapest():
+    controller = CanvasController(budget_ms=500)
+    _, megapixels = controller.choose(2000, 2000)
+    assert megapixels * 400.0 <= 500
+    _, cheapest = controller.choose(2000, 2000, remaining_ms=0)
+    assert cheapest == min(option[2] for option in resolution_options(2000, 2000))
+
+
+def test_sustained_overruns_step_the_bucket_down():
+    controller = CanvasController(budget_ms=500, cooldown=5)
+    bucket = bucket_for(2000, 2000)
+    before, _ = controller.choose(2000, 2000)
+    for _ in range(5):
+        controller.record(bucket, 1.0, 400.0, 'x')
+        controller.record(bucket, 1.0, 2000.0, 'x')
+    assert controller.report()[0]['penalty'] >= 1
+    after, _ = controller.choose(2000, 2000)
+    assert (after['canvas_size'], after['mag_ratio']) != (before['canvas_size'], before['mag_ratio'])
+
+
+def test_calls_inside_one_image_are_recorded_once():
+    reader, controller = FakeReader(), CanvasController(budget_ms=500)
+    budgeted = BudgetedReader(reader, controller)
+    image = Image((2000, 2000, 3))
+    with image_budget(budgeted, image):
+        budgeted.readtext(image)
+        # A 2x tier of the same image stays in the image's bucket.
+        budgeted.readtext(Image((4000, 4000, 3)), canvas_size=1600)
+    assert len(reader.calls) == 2
+    assert reader.calls[1]['canvas_size'] <= 1600
+    rows = controller.report()
+    assert len(rows) == 1 and rows[0]['images'] == 1
+    assert rows[0]['bucket'] == '1600-3200px'
+
+
+def test_call_outside_an_image_scope_is_its_own_image():
+    reader, controller = FakeReader(), CanvasController(budget_ms=500)
+    budgeted = BudgetedReader(reader, controller)
+    budgeted.readtext(Image((300, 300, 3)))
+    budgeted.readtext(Image((300, 300, 3)))
+    assert controller.report()[0]['images'] == 2
+    assert {'canvas_size', 'mag_ratio', 'batch_size'} <= set(reader.calls[0])
+
+
+def test_image_budget_is_a_no_op_for_plain_readers():
+    with image_budget(FakeReader(), Image((10, 10))):
+        pass
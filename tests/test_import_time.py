@@ -0,0 +1,14 @@
+import pytest
+
+from amazon_ml.bench.import_time import measure_import
+
+# Generous compared to the 50 ms the bench script checks, so a loaded CI machine does not flake.
+IMPORT_BUDGET_MS = 100.0
+
+
+@pytest.mark.parametrize('module', ['amazon_ml.extract', 'amazon_ml', 'amazon_ml.cli'])
+def test_light_modules_import_within_budget(module):
+    # cv2, numpy, easyocr, torch, matplotlib and pandas must only load on first use.
+    elapsed, heavy = measure_import(module, repeat=5)
+    assert heavy == []
+    assert elapsed <= IMPORT_BUDGET_MS, f"{module} took {elapsed:.1f} ms to import"
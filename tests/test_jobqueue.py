@@ -0,0 +1,107 @@
+import csv
+import threading
+
+import pytest
+
+from amazon_ml.jobqueue import DONE, FAILED, LEASED, PENDING, JobQueue, run_worker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    csv_path = tmp_path / 'rows.csv'
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['index', 'image_link', 'group_id', 'entity_name'])
+        for i in range(5):
+            writer.writerow([i, f"https://example.com/{i}.jpg", '442321', 'height'])
+    queue = JobQueue(str(tmp_path / 'jobs.db'), max_attempts=2)
+    assert queue.enqueue_csv(str(csv_path)) == 5
+    # Re-enqueueing the same rows is a no-op.
+    assert queue.enqueue_csv(str(csv_path)) == 0
+    yield queue
+    queue.close()
+
+
+def test_claims_do_not_overlap(queue):
+    first = queue.claim('a', batch_size=3)
+    second = queue.claim('b', batch_size=3)
+    assert [job.id for job in first] == [0, 1, 2]
+    assert [job.id for job in second] == [3, 4]
+    assert queue.claim('c') == []
+    assert queue.stats() == {LEASED: 5}
+
+
+def test_expired_lease_is_reclaimed_and_stale_owner_cannot_complete(queue):
+    (job,) = queue.claim('crashed', batch_size=1, lease_seconds=-1)
+    (again,) = queue.claim('b', batch_size=1)
+    assert again.id == job.id and again.attempts == 2
+    assert not queue.complete('crashed', job.id, '1.0 centimetre')
+    assert queue.complete('b', job.id, '1.0 centimetre')
+
+
+def test_renew_keeps_lease(queue):
+    (job,) = queue.claim('a', batch_size=1, lease_seconds=-1)
+    assert queue.renew('a', [job.id], lease_seconds=300) == 1
+    assert job.id not in [j.id for j in queue.claim('b', batch_size=5)]
+
+
+def test_failures_retry_until_max_attempts(queue):
+    (job,) = queue.claim('a', batch_size=1)
+    queue.fail('a', job.id, 'timeout')
+    (retry,) = queue.claim('a', batch_size=1)
+    assert retry.id == job.id
+    queue.fail('a', job.id, 'timeout')
+    assert job.id not in [j.id for j in queue.claim('a', batch_size=5)]
+    assert queue.stats()[FAILED] == 1
+
+
+def test_lease_expiring_on_last_attempt_is_failed(queue):
+    for _ in range(2):
+        queue.claim('crashed', batch_size=5, lease_seconds=-1)
+    assert queue.claim('b', batch_size=5) == []
+    assert queue.stats() == {FAILED: 5}
+    assert queue.requeue_expired() == 0
+
+
+def test_requeue_expired(queue):
+    queue.claim('crashed', batch_size=2, lease_seconds=-1)
+    assert queue.requeue_expired() == 2
+    assert queue.stats() == {PENDING: 5}
+
+
+def test_run_worker_processes_everything_and_records_errors(queue):
+    def handler(job):
+        if job.id == 3:
+            raise RuntimeError('bad image')
+        return f"{job.id}.0 centimetre"
+
+    assert run_worker(queue, handler, worker_id='w', batch_size=2) == 4
+    assert queue.stats() == {DONE: 4, FAILED: 1}
+
+
+def test_waiting_worker_exits_once_nothing_is_left(queue):
+    # Run in a thread so a worker that never exits fails the test instead of hanging it.
+    completed = []
+
+    def work():
+        worker_queue = JobQueue(queue.path)
+        completed.append(run_worker(worker_queue, lambda job: '', idle_exit=False, poll_seconds=0.01))
+        completed.append(run_worker(worker_queue, lambda job: '', idle_exit=False, poll_seconds=0.01))
+        worker_queue.close()
+
+    thread = threading.Thread(target=work, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert completed == [5, 0]
+
+
+def test_export_in_index_order(queue, tmp_path):
+    (job,) = queue.claim('a', batch_size=1)
+    queue.complete('a', job.id, '12.0 centimetre')
+    out = tmp_path / 'submission.csv'
+    assert queue.export(str(out)) == 5
+    with open(out, newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['index', 'prediction']
+    assert rows[1:] == [['0', '12.0 centimetre']] + [[str(i), ''] for i in range(1, 5)]
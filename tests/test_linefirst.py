@@ -0,0 +1,33 @@
+import pytest
+
+pytest.importorskip('cv2')
+
+from amazon_ml.linefirst import BAND_FRACTION, VERTICAL_BAND_SCALE, line_bands  # noqa: E402
+
+
+def overlaps(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def test_bands_cover_line_ends_and_midpoint_inside_the_image():
+    height, width = 1000, 800
+    segments = [(100, 50, 100, 950), (50, 900, 750, 900)]
+    windows = line_bands(segments, height, width)
+    for x0, y0, x1, y1 in windows:
+        assert 0 <= x0 < x1 <= width and 0 <= y0 < y1 <= height
+    for x1, y1, x2, y2 in segments:
+        for x, y in ((x1, y1), (x2, y2), ((x1 + x2) // 2, (y1 + y2) // 2)):
+            assert any(w[0] <= x < w[2] and w[1] <= y < w[3] for w in windows)
+
+
+def test_merged_bands_do_not_overlap():
+    segments = [(100, 100, 100, 400), (110, 120, 110, 380), (100, 400, 500, 400), (600, 50, 600, 300)]
+    windows = line_bands(segments, 800, 800)
+    assert not any(overlaps(a, b) for i, a in enumerate(windows) for b in windows[i + 1:])
+
+
+def test_vertical_line_bands_reach_sideways_labels():
+    height, width = 800, 800
+    band = int(BAND_FRACTION * min(height, width))
+    (x0, _, x1, _), *_ = line_bands([(400, 100, 400, 700)], height, width)
+    assert x1 - 400 == int(VERTICAL_BAND_SCALE * band) and 400 - x0 == int(VERTICAL_BAND_SCALE * band)
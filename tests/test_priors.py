@@ -0,0 +1,89 @@
+import csv
+import math
+import struct
+
+import pytest
+
+from amazon_ml.extract import extract_info, format_prediction, process_units, rank_by_prior
+from amazon_ml.priors import HEADER_FORMAT, MAGIC, PriorIndex, UnitPrior, build_prior_index
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    csv_path = tmp_path / 'labelled.csv'
+    rows = [('100', 'height', '10.0 centimetre')] * 3 + [('100', 'height', '4.0 inch')] + \
+           [('200', 'height', '12.0 inch')] * 2 + [('200', 'item_weight', '500.0 gram')] + \
+           [('', 'height', '3.0 centimetre'), ('300', 'height', '')]
+    with open(csv_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['group_id', 'entity_name', 'entity_value'])
+        writer.writerows(rows)
+    out = tmp_path / 'priors.bin'
+    # (100, height), (200, height), (200, item_weight) and the two entity-wide records.
+    assert build_prior_index([str(csv_path)], str(out)) == 5
+    return str(out)
+
+
+def test_group_prior_round_trips(index_path):
+    index = PriorIndex(index_path)
+    prior = index.lookup('100', 'height')
+    assert prior.count == 4
+    assert [unit for unit, *_ in prior.units] == ['centimetre', 'inch']
+    unit, share, low, high = prior.units[0]
+    assert share == pytest.approx(0.75, abs=1 / 255)
+    assert low == pytest.approx(math.log10(10.0), abs=1e-3) and high == pytest.approx(1.0, abs=1e-3)
+    index.close()
+
+
+def test_unknown_group_falls_back_to_entity_prior(index_path):
+    index = PriorIndex(index_path)
+    assert index.lookup('999', 'height').count == 6
+    assert index.lookup(None, 'height').count == 6
+    assert index.lookup('not-a-number', 'height').count == 6
+    assert index.lookup('200', 'item_weight').units[0][0] == 'gram'
+    assert index.lookup('100', 'item_volume') is None
+    index.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / 'bogus.bin'
+    path.write_bytes(struct.pack(HEADER_FORMAT, b'NOPE', 1, 0, 0, 0))
+    with pytest.raises(ValueError):
+        PriorIndex(str(path))
+    path.write_bytes(struct.pack(HEADER_FORMAT, MAGIC, 99, 0, 0, 0))
+    with pytest.raises(ValueError):
+        PriorIndex(str(path))
+
+
+# cm heights of 10^0.5..10^1.5, inches as the less likely second unit.
+HEIGHT_PRIOR = UnitPrior([('centimetre', 0.8, 0.5, 1.5), ('inch', 0.2, 0.3, 1.2)], 50)
+
+
+def test_likeliest_plausible_unit_wins():
+    candidates = [(12.0, 'in'), (30.0, 'cm'), (7.5, 'inches')]
+    assert rank_by_prior(candidates, HEIGHT_PRIOR) == [(30.0, 'centimetre')]
+    # No plausible cm value: the next unit in the prior is used.
+    assert rank_by_prior([(12.0, 'in'), (50000.0, 'cm')], HEIGHT_PRIOR) == [(12.0, 'inch')]
+
+
+def test_implausible_values_are_dropped():
+    assert rank_by_prior([(50000.0, 'cm')], HEIGHT_PRIOR) == []
+    assert extract_info('Height 50000 cm', 'height', prior=HEIGHT_PRIOR) == 'Not found'
+    assert format_prediction('Height 50000 cm', 'height', prior=HEIGHT_PRIOR) == ''
+
+
+def test_units_without_a_range_are_kept_when_nothing_plausible():
+    assert rank_by_prior([(50000.0, 'cm'), (2.0, 'ft')], HEIGHT_PRIOR) == [(2.0, 'ft')]
+    assert format_prediction('50000 cm or 2 ft', 'height', prior=HEIGHT_PRIOR) == '2.0 foot'
+
+
+def test_format_prediction_prefers_the_prior_unit():
+    text = 'Size 4 inches / 10.2 cm'
+    assert format_prediction(text, 'height') == '4.0 inch'
+    assert format_prediction(text, 'height', prior=HEIGHT_PRIOR) == '10.2 centimetre'
+
+
+def test_process_units_with_prior():
+    assert process_units(['4in', '10cm', '25cm']) == ([4.0], 'in')
+    assert process_units(['4in', '10cm', '25cm'], prior=HEIGHT_PRIOR) == ([10.0, 25.0], 'centimetre')
+    assert process_units(['50000cm'], prior=HEIGHT_PRIOR) == ([], None)
@@ -0,0 +1,45 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from amazon_ml.tiling import dedupe_boxes, iter_tiles  # noqa: E402
+
+
+def box(x0, y0, x1, y1):
+    return [[x0, y0], [x1, y0], [x1, y1], [x0, y1]]
+
+
+@pytest.mark.parametrize('height,width', [(500, 500), (1000, 3000), (4100, 2500), (1300, 640)])
+def test_tiles_cover_the_image_with_overlap(height, width):
+    tile_size, overlap = 640, 64
+    tiles = list(iter_tiles(height, width, tile_size, overlap))
+    for x0, y0, x1, y1 in tiles:
+        assert 0 <= x0 < x1 <= width and 0 <= y0 < y1 <= height
+        assert x1 - x0 <= tile_size and y1 - y0 <= tile_size
+    for x in range(0, width, 7):
+        for y in range(0, height, 7):
+            assert any(x0 <= x < x1 and y0 <= y < y1 for x0, y0, x1, y1 in tiles)
+    # Neighbouring tiles overlap by at least `overlap` so no word is only seen cut in half.
+    xs = sorted({x0 for x0, _, _, _ in tiles})
+    assert all(b - a <= tile_size - overlap for a, b in zip(xs, xs[1:]))
+
+
+def test_small_image_is_one_tile():
+    assert list(iter_tiles(300, 200, 640)) == [(0, 0, 200, 300)]
+
+
+def test_seam_duplicate_is_dropped_and_whole_word_kept():
+    whole = (box(600, 100, 700, 130), '12.5 cm', 0.9)
+    truncated = (box(600, 100, 640, 130), '12.', 0.95)
+    other = (box(100, 400, 180, 430), '30 cm', 0.8)
+    assert dedupe_boxes([truncated, other, whole]) == [whole, other]
+
+
+def test_equal_boxes_keep_the_more_confident():
+    low, high = (box(0, 0, 50, 20), '5O', 0.4), (box(0, 0, 50, 20), '50', 0.9)
+    assert dedupe_boxes([low, high]) == [high]
+
+
+def test_partial_overlap_below_containment_is_kept():
+    left, right = (box(0, 0, 100, 20), 'a', 0.9), (box(80, 0, 180, 20), 'b', 0.9)
+    assert len(dedupe_boxes([left, right])) == 2
@@ -0,0 +1,100 @@
+import pickle
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from amazon_ml.transport import ALIGNMENT, SharedRing  # noqa: E402
+
+
+@pytest.fixture
+def ring():
+    ring = SharedRing(size_mb=1)
+    yield ring
+    ring.close()
+
+
+def frame(height, width, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+def test_put_and_view_round_trip(ring):
+    image = frame(120, 90)
+    handle = ring.put(image)
+    view = ring.view(handle)
+    assert view.shape == image.shape and view.dtype == image.dtype
+    assert (view == image).all()
+    assert handle.offset % ALIGNMENT == 0
+    del view
+
+
+def test_crop_shares_the_frame(ring):
+    image = frame(100, 100)
+    handle = ring.put(image)
+    crop = ring.view(ring.crop(handle, 10, 20, 60, 50))
+    assert (crop == image[20:50, 10:60]).all()
+    ring.view(handle)[25, 15] = 7
+    assert (crop[5, 5] == 7).all()
+    # Crops are clamped to the frame.
+    assert ring.crop(handle, -5, 90, 200, 300).shape == (10, 100, 3)
+    del crop
+
+
+def test_wrap_around_keeps_frames_intact(ring):
+    rng = np.random.default_rng(1)
+    pending = []
+    for i in range(500):
+        image = frame(int(rng.integers(1, 200)), int(rng.integers(1, 200)), seed=i)
+        try:
+            handle = ring.put(image, timeout=0)
+        except TimeoutError:
+            # Consumer catches up, releasing in arrival order.
+            for old_handle, old_image in pending:
+                assert (ring.view(old_handle) == old_image).all()
+                ring.release(old_handle)
+            pending = []
+            handle = ring.put(image, timeout=0)
+        pending.append((handle, image))
+    assert all((ring.view(h) == image).all() for h, image in pending)
+
+
+def test_release_is_cumulative(ring):
+    handles = [ring.put(frame(50, 50, seed=i)) for i in range(3)]
+    assert ring.in_use() > 0
+    ring.release(handles[-1])
+    assert ring.in_use() == 0
+    # Releasing an older frame afterwards does not move the tail back.
+    ring.release(handles[0])
+    assert ring.in_use() == 0
+
+
+def test_full_ring_times_out_and_oversized_frames_are_rejected(ring):
+    ring.put(np.zeros(ring.capacity - ALIGNMENT, dtype=np.uint8))
+    with pytest.raises(TimeoutError):
+        ring.put(np.zeros(2 * ALIGNMENT, dtype=np.uint8), timeout=0)
+    with pytest.raises(ValueError):
+        ring.put(np.zeros(ring.capacity + 1, dtype=np.uint8))
+
+
+def test_release_rejects_foreign_handles(ring):
+    with SharedRing(size_mb=1) as other:
+        handle = other.put(frame(10, 10))
+        with pytest.raises(ValueError):
+            ring.release(handle)
+
+
+def test_pickled_ring_attaches_to_the_same_block(ring):
+    image = frame(64, 48)
+    handle = ring.put(image)
+    attached = pickle.loads(pickle.dumps(ring))
+    assert attached.name == ring.name and attached.capacity == ring.capacity
+    view = attached.view(handle)
+    assert (view == image).all()
+    del view
+    attached.release(handle)
+    assert ring.in_use() == 0
+    # Closing an attached ring must not unlink the owner's block.
+    attached.close()
+    view = ring.view(handle)
+    assert (view == image).all()
+    del view